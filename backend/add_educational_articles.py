@@ -17,6 +17,7 @@ from app.models.organization import Organization
 from app.models.employee import Employee
 from app.models.join_request import JoinRequest
 from app.core.security import get_password_hash
+from app.crud import category as crud_category
 from datetime import datetime
 
 def create_categories(db: Session):
@@ -210,6 +211,8 @@ def main():
         # Создаем статьи
         print("Создание статей:")
         created_count = create_articles(db, admin.id, categories)
+        # Статьи создаются в обход crud, поэтому пересчитываем счётчики категорий
+        crud_category.reconcile_announcements_counts(db)
         print()
 
         print("="*60)
@@ -0,0 +1,30 @@
+"""add category-first index on announcement_categories
+
+Revision ID: add_ann_categories_category_idx
+Revises: add_announcement_text_fields
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_ann_categories_category_idx'
+down_revision = 'add_announcement_text_fields'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The (announcement_id, category_id) primary key cannot serve lookups by category
+    op.create_index(
+        'ix_announcement_categories_category_id',
+        'announcement_categories',
+        ['category_id', 'announcement_id'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_announcement_categories_category_id', table_name='announcement_categories')
@@ -0,0 +1,31 @@
+"""add derived text fields to announcements
+
+Revision ID: add_announcement_text_fields
+Revises: add_search_documents
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_announcement_text_fields'
+down_revision = 'add_search_documents'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('announcements', sa.Column('plain_text', sa.Text(), nullable=True))
+    op.add_column('announcements', sa.Column('word_count', sa.Integer(), nullable=True))
+    op.add_column('announcements', sa.Column('reading_time', sa.Integer(), nullable=True))
+    op.add_column('announcements', sa.Column('auto_excerpt', sa.Text(), nullable=True))
+    # Existing rows are filled by running backfill_announcement_text.py
+
+
+def downgrade():
+    op.drop_column('announcements', 'auto_excerpt')
+    op.drop_column('announcements', 'reading_time')
+    op.drop_column('announcements', 'word_count')
+    op.drop_column('announcements', 'plain_text')
@@ -0,0 +1,38 @@
+"""add registrations_count to events
+
+Revision ID: add_event_registrations_count
+Revises: add_events_tables
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_event_registrations_count'
+down_revision = 'add_events_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'events',
+        sa.Column('registrations_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    # Backfill from existing confirmed registrations
+    op.execute(
+        """
+        UPDATE events SET registrations_count = (
+            SELECT COUNT(*) FROM event_registrations
+            WHERE event_registrations.event_id = events.id
+            AND event_registrations.status = 'CONFIRMED'
+        )
+        """
+    )
+
+
+def downgrade():
+    op.drop_column('events', 'registrations_count')
@@ -0,0 +1,53 @@
+"""add feed counters to categories and organizations
+
+Revision ID: add_feed_counters
+Revises: add_ann_categories_category_idx
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_feed_counters'
+down_revision = 'add_ann_categories_category_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'categories',
+        sa.Column('announcements_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'organizations',
+        sa.Column('announcements_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    # Backfill from existing published announcements
+    op.execute(
+        """
+        UPDATE categories SET announcements_count = (
+            SELECT COUNT(*) FROM announcement_categories
+            JOIN announcements ON announcements.id = announcement_categories.announcement_id
+            WHERE announcement_categories.category_id = categories.id
+            AND announcements.status = 'PUBLISHED'
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE organizations SET announcements_count = (
+            SELECT COUNT(*) FROM announcements
+            WHERE announcements.organization_id = organizations.id
+            AND announcements.status = 'PUBLISHED'
+        )
+        """
+    )
+
+
+def downgrade():
+    op.drop_column('organizations', 'announcements_count')
+    op.drop_column('categories', 'announcements_count')
@@ -0,0 +1,34 @@
+"""add composite indexes for feed and lookup queries
+
+Revision ID: add_feed_query_indexes
+Revises: add_waitlisted_status
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_feed_query_indexes'
+down_revision = 'add_waitlisted_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_announcements_status_created_at', 'announcements', ['status', 'created_at'], unique=False)
+    op.create_index('ix_announcements_status_published_at', 'announcements', ['status', 'published_at', 'id'], unique=False)
+    op.create_index('ix_events_status_event_date', 'events', ['status', 'event_date', 'id'], unique=False)
+    op.create_index('ix_event_registrations_event_id_status', 'event_registrations', ['event_id', 'status'], unique=False)
+    op.create_index('ix_employees_user_id_organization_id', 'employees', ['user_id', 'organization_id'], unique=False)
+    op.create_index('ix_join_requests_organization_id_status', 'join_requests', ['organization_id', 'status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_join_requests_organization_id_status', table_name='join_requests')
+    op.drop_index('ix_employees_user_id_organization_id', table_name='employees')
+    op.drop_index('ix_event_registrations_event_id_status', table_name='event_registrations')
+    op.drop_index('ix_events_status_event_date', table_name='events')
+    op.drop_index('ix_announcements_status_published_at', table_name='announcements')
+    op.drop_index('ix_announcements_status_created_at', table_name='announcements')
@@ -0,0 +1,59 @@
+"""add full-text search index
+
+Revision ID: add_search_documents
+Revises: add_refresh_tokens
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_search_documents'
+down_revision = 'add_refresh_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    vector_type = postgresql.TSVECTOR() if dialect == 'postgresql' else sa.Text()
+
+    op.create_table(
+        'search_documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('doc_type', sa.String(length=20), nullable=False),
+        sa.Column('doc_id', sa.Integer(), nullable=False),
+        sa.Column('slug', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('excerpt', sa.Text(), nullable=True),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('search_vector', vector_type, nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('doc_type', 'doc_id', name='uq_search_documents_doc')
+    )
+    op.create_index(op.f('ix_search_documents_id'), 'search_documents', ['id'], unique=False)
+
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_search_documents_search_vector', 'search_documents', ['search_vector'],
+            unique=False, postgresql_using='gin'
+        )
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts "
+            "USING fts5(title, excerpt, body, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    # Existing content is indexed by running reindex_search.py
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_search_documents_search_vector', table_name='search_documents')
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS search_documents_fts")
+    op.drop_index(op.f('ix_search_documents_id'), table_name='search_documents')
+    op.drop_table('search_documents')
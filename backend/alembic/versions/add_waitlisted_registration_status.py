@@ -0,0 +1,28 @@
+"""add waitlisted registration status
+
+Revision ID: add_waitlisted_status
+Revises: add_event_registrations_count
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_waitlisted_status'
+down_revision = 'add_event_registrations_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Only PostgreSQL has a native enum type to extend; other dialects store plain strings
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE registrationstatus ADD VALUE IF NOT EXISTS 'WAITLISTED'")
+
+
+def downgrade():
+    # PostgreSQL cannot drop enum values; move waitlisted rows out of the way instead
+    op.execute("UPDATE event_registrations SET status = 'CANCELLED' WHERE status = 'WAITLISTED'")
@@ -0,0 +1,32 @@
+"""backfill published_at of announcements published without one
+
+Revision ID: backfill_published_at
+Revises: add_feed_counters
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'backfill_published_at'
+down_revision = 'add_feed_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_announcement used to leave published_at empty for announcements created
+    # as published; the keyset feed skips such rows and PostgreSQL sorts them first
+    op.execute(
+        """
+        UPDATE announcements SET published_at = created_at
+        WHERE status = 'PUBLISHED' AND published_at IS NULL
+        """
+    )
+
+
+def downgrade():
+    # The backfilled values cannot be told apart from real ones
+    pass
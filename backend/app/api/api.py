@@ -1,8 +1,16 @@
 from fastapi import APIRouter
-from .endpoints import auth, users, categories, announcements, upload, organizations, employees, join_requests, events
+from ..core.config import settings
+from .endpoints import auth, users, categories, announcements, upload, organizations, employees, join_requests, events, search
 
 api_router = APIRouter()
 
+if settings.DATABASE_ASYNC:
+    # Async read endpoints take precedence over the matching sync routes,
+    # which keep documenting the (identical) API in the schema
+    from .endpoints import async_announcements, async_events
+    api_router.include_router(async_announcements.router, prefix="/announcements", include_in_schema=False)
+    api_router.include_router(async_events.router, prefix="/events", include_in_schema=False)
+
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
@@ -12,3 +20,4 @@ api_router.include_router(employees.router, prefix="/employees", tags=["employee
 api_router.include_router(join_requests.router, prefix="/join-requests", tags=["join-requests"])
 api_router.include_router(events.router, prefix="/events", tags=["events"])
 api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from ..core.config import settings
 from ..core.database import get_db
 from ..models.user import User, UserRole
+from ..crud.user import get_user_cached
 from ..schemas.user import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
@@ -33,7 +34,7 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == token_data.sub).first()
+    user = get_user_cached(db, token_data.sub)
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -91,7 +92,7 @@ def get_current_user_optional(
     except JWTError:
         return None
 
-    user = db.query(User).filter(User.id == token_data.sub).first()
+    user = get_user_cached(db, token_data.sub)
     if user is None or not user.is_active:
         return None
     return user
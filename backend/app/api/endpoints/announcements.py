@@ -1,14 +1,16 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from ...core.database import get_db
+from ...core.pagination import encode_cursor, decode_cursor
 from ...api.deps import get_current_user, get_current_moderator
 from ...schemas.announcement import (
     Announcement as AnnouncementSchema,
     AnnouncementCreate,
     AnnouncementUpdate,
-    AnnouncementList
+    AnnouncementList,
+    AnnouncementPage
 )
 from ...crud import announcement as crud_announcement
 from ...models.announcement import AnnouncementStatus
@@ -21,28 +23,59 @@ router = APIRouter()
 def read_announcements(
     skip: int = 0,
     limit: int = 20,
-    category_id: Optional[int] = None,
+    category_id: Optional[List[int]] = Query(None, description="Repeat to filter by several categories"),
+    category_match: Literal["any", "all"] = "any",
     db: Session = Depends(get_db),
 ):
-    """Get published announcements (public)"""
+    """Get published announcements, optionally filtered by categories (public)"""
     announcements = crud_announcement.get_published_announcements(
-        db, skip=skip, limit=limit
+        db, skip=skip, limit=limit, category_ids=category_id, category_match=category_match
     )
     return announcements
 
 
+@router.get("/feed", response_model=AnnouncementPage)
+def read_announcements_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    category_id: Optional[List[int]] = Query(None, description="Repeat to filter by several categories"),
+    category_match: Literal["any", "all"] = "any",
+    db: Session = Depends(get_db),
+):
+    """Get published announcements with cursor pagination (public)"""
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Fetch one extra row to know whether another page exists
+    announcements = crud_announcement.get_published_announcements_after(
+        db, cursor=position, limit=limit + 1, category_ids=category_id, category_match=category_match
+    )
+
+    next_cursor = None
+    if len(announcements) > limit:
+        announcements = announcements[:limit]
+        last = announcements[-1]
+        next_cursor = encode_cursor(last.published_at, last.id)
+
+    return {"items": announcements, "next_cursor": next_cursor}
+
+
 @router.get("/all", response_model=List[AnnouncementList])
 def read_all_announcements(
     skip: int = 0,
     limit: int = 100,
     status: Optional[AnnouncementStatus] = None,
-    category_id: Optional[int] = None,
+    category_id: Optional[List[int]] = Query(None),
+    category_match: Literal["any", "all"] = "any",
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_moderator),
 ):
     """Get all announcements with filters (moderator/admin only)"""
     announcements = crud_announcement.get_announcements(
-        db, skip=skip, limit=limit, status=status, category_id=category_id
+        db, skip=skip, limit=limit, status=status,
+        category_ids=category_id, category_match=category_match
     )
     return announcements
 
@@ -0,0 +1,74 @@
+"""Async variants of the public announcement read endpoints.
+
+Registered ahead of the sync router when DATABASE_ASYNC is enabled.
+"""
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.database import get_async_db
+from ...core.pagination import encode_cursor, decode_cursor
+from ...schemas.announcement import (
+    Announcement as AnnouncementSchema,
+    AnnouncementList,
+    AnnouncementPage
+)
+from ...crud import async_announcement as crud_announcement
+from ...models.announcement import AnnouncementStatus
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[AnnouncementList])
+async def read_announcements(
+    skip: int = 0,
+    limit: int = 20,
+    category_id: Optional[List[int]] = Query(None, description="Repeat to filter by several categories"),
+    category_match: Literal["any", "all"] = "any",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get published announcements, optionally filtered by categories (public)"""
+    return await crud_announcement.get_published_announcements(
+        db, skip=skip, limit=limit, category_ids=category_id, category_match=category_match
+    )
+
+
+@router.get("/feed", response_model=AnnouncementPage)
+async def read_announcements_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    category_id: Optional[List[int]] = Query(None, description="Repeat to filter by several categories"),
+    category_match: Literal["any", "all"] = "any",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get published announcements with cursor pagination (public)"""
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Fetch one extra row to know whether another page exists
+    announcements = await crud_announcement.get_published_announcements_after(
+        db, cursor=position, limit=limit + 1, category_ids=category_id, category_match=category_match
+    )
+
+    next_cursor = None
+    if len(announcements) > limit:
+        announcements = announcements[:limit]
+        last = announcements[-1]
+        next_cursor = encode_cursor(last.published_at, last.id)
+
+    return {"items": announcements, "next_cursor": next_cursor}
+
+
+@router.get("/slug/{slug}", response_model=AnnouncementSchema)
+async def read_announcement_by_slug(
+    slug: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get announcement by slug (public if published)"""
+    announcement = await crud_announcement.get_announcement_by_slug(db, slug=slug)
+    if not announcement or announcement.status != AnnouncementStatus.PUBLISHED:
+        raise HTTPException(status_code=404, detail="Announcement not found")
+
+    return announcement
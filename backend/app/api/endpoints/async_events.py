@@ -0,0 +1,80 @@
+"""Async variants of the public event read endpoints.
+
+Registered ahead of the sync router when DATABASE_ASYNC is enabled.
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.database import get_async_db
+from ...core.pagination import encode_cursor, decode_cursor
+from ...crud import async_event as crud_event
+from ...schemas import event as event_schema
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[event_schema.EventList])
+async def get_events(
+    skip: int = 0,
+    limit: int = 100,
+    status_filter: str = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get all events (public)"""
+    if status_filter:
+        return await crud_event.get_events(db, skip=skip, limit=limit, status=status_filter)
+    return await crud_event.get_published_events(db, skip=skip, limit=limit)
+
+
+@router.get("/upcoming", response_model=List[event_schema.EventList])
+async def get_upcoming_events(
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get upcoming published events"""
+    return await crud_event.get_upcoming_events(db, skip=skip, limit=limit)
+
+
+@router.get("/feed", response_model=event_schema.EventPage)
+async def get_events_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get published events with cursor pagination (public)"""
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    # Fetch one extra row to know whether another page exists
+    events = await crud_event.get_published_events_after(db, cursor=position, limit=limit + 1)
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        next_cursor = encode_cursor(last.event_date, last.id)
+
+    return {"items": events, "next_cursor": next_cursor}
+
+
+@router.get("/{slug}", response_model=event_schema.EventOut)
+async def get_event(
+    slug: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get event by slug"""
+    event = await crud_event.get_event_by_slug(db, slug)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+
+    return event
@@ -2,25 +2,50 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from ...core.database import get_db
 from ...core.config import settings
-from ...core.security import create_access_token
-from ...schemas.user import Token, LoginRequest, User as UserSchema, UserCreate
+from ...core.security import create_access_token, get_password_hash_async, PasswordHashingBusy
+from ...schemas.user import Token, LoginRequest, RefreshRequest, User as UserSchema, UserCreate
 from ...crud import user as crud_user
+from ...crud import refresh_token as crud_refresh_token
 from ...models.user import UserRole
 
 router = APIRouter()
 
+# Login and registration are async so that bcrypt runs on the dedicated password
+# executor instead of holding a threadpool thread; DB calls go to the threadpool.
+
+busy_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Too many authentication requests, please retry",
+    headers={"Retry-After": "1"},
+)
+
+invalid_refresh_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid refresh token",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+def _token_response(user_id: int, refresh_token: str) -> dict:
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        subject=user_id, expires_delta=access_token_expires
+    )
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
+
 
 @router.post("/register", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     user_in: UserCreate,
     db: Session = Depends(get_db)
 ):
     """Register new user (public registration creates regular users)"""
     # Check if user already exists
-    user = crud_user.get_user_by_email(db, email=user_in.email)
+    user = await run_in_threadpool(crud_user.get_user_by_email, db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,17 +54,28 @@ def register(
 
     # Force role to USER for public registration
     user_in.role = UserRole.USER
-    user = crud_user.create_user(db=db, user=user_in)
+
+    # Return the pooled connection while waiting for bcrypt
+    await run_in_threadpool(db.close)
+    try:
+        hashed_password = await get_password_hash_async(user_in.password)
+    except PasswordHashingBusy:
+        raise busy_exception
+
+    user = await run_in_threadpool(crud_user.create_user, db=db, user=user_in, hashed_password=hashed_password)
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     login_data: LoginRequest,
     db: Session = Depends(get_db)
 ):
     """Login and get access token"""
-    user = crud_user.authenticate_user(db, email=login_data.email, password=login_data.password)
+    try:
+        user = await crud_user.authenticate_user_async(db, email=login_data.email, password=login_data.password)
+    except PasswordHashingBusy:
+        raise busy_exception
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,20 +85,20 @@ def login(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    refresh_token = await run_in_threadpool(crud_refresh_token.create_refresh_token, db, user.id)
+    return _token_response(user.id, refresh_token)
 
 
 @router.post("/token", response_model=Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """OAuth2 compatible token login (for Swagger UI)"""
-    user = crud_user.authenticate_user(db, email=form_data.username, password=form_data.password)
+    try:
+        user = await crud_user.authenticate_user_async(db, email=form_data.username, password=form_data.password)
+    except PasswordHashingBusy:
+        raise busy_exception
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -70,8 +106,33 @@ def login_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    refresh_token = await run_in_threadpool(crud_refresh_token.create_refresh_token, db, user.id)
+    return _token_response(user.id, refresh_token)
+
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(
+    refresh_in: RefreshRequest,
+    db: Session = Depends(get_db)
+):
+    """Exchange a refresh token for a new access token (the refresh token is rotated)"""
+    rotated = crud_refresh_token.rotate_refresh_token(db, refresh_in.refresh_token)
+    if not rotated:
+        raise invalid_refresh_exception
+
+    user_id, refresh_token = rotated
+    user = crud_user.get_user_cached(db, user_id)
+    if not user or not user.is_active:
+        crud_refresh_token.revoke_refresh_token(db, refresh_token)
+        raise invalid_refresh_exception
+
+    return _token_response(user_id, refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    refresh_in: RefreshRequest,
+    db: Session = Depends(get_db)
+):
+    """Revoke the session a refresh token belongs to"""
+    crud_refresh_token.revoke_refresh_token(db, refresh_in.refresh_token)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ...api import deps
+from ...core.pagination import encode_cursor, decode_cursor
 from ...crud import event as crud_event
 from ...crud import event_registration as crud_registration
 from ...models.user import User
@@ -25,14 +26,7 @@ def get_events(
     else:
         events = crud_event.get_published_events(db, skip=skip, limit=limit)
 
-    # Add registrations count
-    result = []
-    for event in events:
-        event_dict = event_schema.EventList.model_validate(event).model_dump()
-        event_dict['registrations_count'] = crud_event.get_registrations_count(db, event.id)
-        result.append(event_schema.EventList(**event_dict))
-
-    return result
+    return events
 
 
 @router.get("/upcoming", response_model=List[event_schema.EventList])
@@ -42,15 +36,34 @@ def get_upcoming_events(
     db: Session = Depends(deps.get_db),
 ):
     """Get upcoming published events"""
-    events = crud_event.get_upcoming_events(db, skip=skip, limit=limit)
+    return crud_event.get_upcoming_events(db, skip=skip, limit=limit)
+
 
-    result = []
-    for event in events:
-        event_dict = event_schema.EventList.model_validate(event).model_dump()
-        event_dict['registrations_count'] = crud_event.get_registrations_count(db, event.id)
-        result.append(event_schema.EventList(**event_dict))
+@router.get("/feed", response_model=event_schema.EventPage)
+def get_events_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(deps.get_db),
+):
+    """Get published events with cursor pagination (public)"""
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
-    return result
+    # Fetch one extra row to know whether another page exists
+    events = crud_event.get_published_events_after(db, cursor=position, limit=limit + 1)
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        last = events[-1]
+        next_cursor = encode_cursor(last.event_date, last.id)
+
+    return {"items": events, "next_cursor": next_cursor}
 
 
 @router.get("/{slug}", response_model=event_schema.EventOut)
@@ -66,9 +79,7 @@ def get_event(
             detail="Event not found"
         )
 
-    event_dict = event_schema.EventOut.model_validate(event).model_dump()
-    event_dict['registrations_count'] = crud_event.get_registrations_count(db, event.id)
-    return event_schema.EventOut(**event_dict)
+    return event
 
 
 @router.post("/", response_model=event_schema.EventOut, status_code=status.HTTP_201_CREATED)
@@ -86,10 +97,7 @@ def create_event(
             detail="Event with this slug already exists"
         )
 
-    db_event = crud_event.create_event(db, event, current_user.id)
-    event_dict = event_schema.EventOut.model_validate(db_event).model_dump()
-    event_dict['registrations_count'] = 0
-    return event_schema.EventOut(**event_dict)
+    return crud_event.create_event(db, event, current_user.id)
 
 
 @router.put("/{event_id}", response_model=event_schema.EventOut)
@@ -116,9 +124,7 @@ def update_event(
             detail="Event not found"
         )
 
-    event_dict = event_schema.EventOut.model_validate(db_event).model_dump()
-    event_dict['registrations_count'] = crud_event.get_registrations_count(db, db_event.id)
-    return event_schema.EventOut(**event_dict)
+    return db_event
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -189,13 +195,6 @@ def register_for_event(
                 detail="Registration deadline has passed"
             )
 
-    # Check if event is full
-    if crud_event.is_event_full(db, event_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Event is full"
-        )
-
     # Check if already registered
     existing = crud_registration.check_existing_registration(
         db,
@@ -210,7 +209,7 @@ def register_for_event(
             detail="Already registered for this event"
         )
 
-    # Create registration
+    # Create registration; the seat is reserved atomically and a full event puts it on the waitlist
     registration.event_id = event_id
     return crud_registration.create_registration(
         db,
@@ -32,7 +32,7 @@ def read_organization(
     organization = crud_organization.get_organization(db, organization_id=organization_id)
     if not organization:
         raise HTTPException(status_code=404, detail="Organization not found")
-    return organization
+    return crud_organization.with_upcoming_events_counts(db, [organization])[0]
 
 
 @router.get("/slug/{slug}", response_model=OrganizationSchema)
@@ -44,7 +44,7 @@ def read_organization_by_slug(
     organization = crud_organization.get_organization_by_slug(db, slug=slug)
     if not organization:
         raise HTTPException(status_code=404, detail="Organization not found")
-    return organization
+    return crud_organization.with_upcoming_events_counts(db, [organization])[0]
 
 
 @router.post("/", response_model=OrganizationSchema, status_code=status.HTTP_201_CREATED)
@@ -99,7 +99,7 @@ def update_organization(
     organization = crud_organization.update_organization(db, organization_id=organization_id, organization=organization_in)
     if not organization:
         raise HTTPException(status_code=404, detail="Organization not found")
-    return organization
+    return crud_organization.with_upcoming_events_counts(db, [organization])[0]
 
 
 @router.delete("/{organization_id}", status_code=status.HTTP_204_NO_CONTENT)
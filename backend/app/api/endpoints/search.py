@@ -0,0 +1,22 @@
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ...core.database import get_db
+from ...schemas.search import SearchResults
+from ...crud import search as crud_search
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResults)
+def search(
+    q: str = Query(..., min_length=2, max_length=200),
+    type: Optional[Literal["announcement", "event"]] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """Full-text search over published announcements and events (public)"""
+    items, total = crud_search.search_documents(db, q, doc_type=type, skip=skip, limit=limit)
+    return {"items": items, "total": total}
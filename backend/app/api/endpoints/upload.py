@@ -1,10 +1,19 @@
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from typing import List, Tuple
+import asyncio
+import hashlib
 import os
+import re
+import time
 import uuid
 from pathlib import Path
 
+import aiofiles
+
 from ...core.config import settings
+from ...core.images import manifest_path, probe_image, process_upload, read_manifest, write_manifest, InvalidImage
+from ...core.jobs import get_job_queue
 from ...api.deps import get_current_moderator
 from ...models.user import User
 
@@ -12,6 +21,9 @@ router = APIRouter()
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 MAX_FILE_SIZE = settings.MAX_UPLOAD_SIZE
+IMAGES_URL = "/uploads/images"
+UPLOAD_ID_RE = re.compile(r"^[A-Za-z0-9-]+$")
+CONTENT_HASH_LENGTH = 32  # hex characters of the SHA-256 used as file name
 
 
 def validate_image(file: UploadFile) -> None:
@@ -25,44 +37,135 @@ def validate_image(file: UploadFile) -> None:
         )
 
 
-def save_upload_file(upload_file: UploadFile, destination: Path) -> None:
-    """Save uploaded file to destination"""
+too_large_exception = HTTPException(
+    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    detail=f"File too large. Maximum size is {MAX_FILE_SIZE} bytes"
+)
+
+
+async def save_upload_file(upload_file: UploadFile, ext: str) -> Tuple[Path, bool]:
+    """Stream an upload into content-addressed storage, enforcing MAX_UPLOAD_SIZE
+
+    Returns the stored path and whether it was newly created (False when an
+    identical file was already stored).
+    """
+    # The multipart parser already knows the size, reject before copying anything
+    if upload_file.size is not None and upload_file.size > MAX_FILE_SIZE:
+        raise too_large_exception
+
+    images_dir = Path(settings.UPLOAD_DIR) / "images"
+    tmp_path = images_dir / f"{uuid.uuid4()}.part"
+    digest = hashlib.sha256()
+    written = 0
     try:
-        with destination.open("wb") as buffer:
-            while chunk := upload_file.file.read(8192):
-                buffer.write(chunk)
+        async with aiofiles.open(tmp_path, "wb") as buffer:
+            while chunk := await upload_file.read(settings.UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_FILE_SIZE:
+                    raise too_large_exception
+                digest.update(chunk)
+                await buffer.write(chunk)
+    except HTTPException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
         )
 
+    # Identical content maps to the same name, so re-uploads are stored once
+    destination = images_dir / f"{digest.hexdigest()[:CONTENT_HASH_LENGTH]}{ext}"
+    if destination.exists():
+        tmp_path.unlink(missing_ok=True)
+        # Restart the gc_uploads grace period (it uses the newest file of an upload); the
+        # manifest keeps its mtime, which times out stuck pending jobs
+        os.utime(destination)
+        return destination, False
+    os.replace(tmp_path, destination)
+    return destination, True
+
+
+def check_image(file_path: Path) -> None:
+    """Reject a saved upload that is not a decodable image"""
+    # Only the header is read here; decoding and resizing happen on the job queue
+    try:
+        probe_image(file_path)
+    except InvalidImage:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is not a valid image"
+        )
+
+
+def pending_expired(file_path: Path) -> bool:
+    """Whether a pending upload has waited longer than its job can take (e.g. the worker died)"""
+    try:
+        age = time.time() - manifest_path(file_path).stat().st_mtime
+    except FileNotFoundError:
+        return True
+    return age > settings.IMAGE_JOB_TIMEOUT
+
+
+def enqueue_image(file_path: Path) -> dict:
+    """Queue variant generation for a checked upload and build the response item"""
+    filename = file_path.name
+    item = {
+        "id": file_path.stem,
+        "filename": filename,
+        "original_url": f"{IMAGES_URL}/{filename}",
+        "status_url": f"{settings.API_V1_STR}/upload/image/{file_path.stem}",
+    }
+
+    # A deduplicated upload reuses the variants of the stored copy
+    manifest = read_manifest(file_path)
+    if manifest and manifest["status"] == "ready":
+        return {**item, **manifest}
+
+    # Rewriting the manifest restarts the timeout, so a stuck job is resubmitted once per period
+    if (
+        not manifest
+        or manifest["status"] == "failed"
+        or (manifest["status"] == "pending" and pending_expired(file_path))
+    ):
+        write_manifest(file_path, {"status": "pending"})
+        get_job_queue().submit(process_upload, str(file_path), IMAGES_URL)
+
+    # The original serves as placeholder until the variants are ready
+    return {**item, "status": "pending", "url": f"{IMAGES_URL}/{filename}"}
+
+
+def upload_extension(file: UploadFile) -> str:
+    """Normalized extension of an upload, so identical content gets one name"""
+    ext = Path(file.filename).suffix.lower()
+    return ".jpg" if ext == ".jpeg" else ext
+
 
 @router.post("/image")
-def upload_image(
+async def upload_image(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_moderator),
 ):
     """Upload image (moderator/admin only)"""
     validate_image(file)
 
-    # Generate unique filename
-    ext = Path(file.filename).suffix.lower()
-    filename = f"{uuid.uuid4()}{ext}"
-    file_path = Path(settings.UPLOAD_DIR) / "images" / filename
-
-    # Save file
-    save_upload_file(file, file_path)
+    # Save file under its content hash
+    file_path, created = await save_upload_file(file, upload_extension(file))
+    # Deduplicated uploads are checked too, the stored copy may predate validation
+    try:
+        await run_in_threadpool(check_image, file_path)
+    except HTTPException:
+        if created:
+            file_path.unlink(missing_ok=True)
+        raise
 
-    # Return URL path
-    return {
-        "filename": filename,
-        "url": f"/uploads/images/{filename}"
-    }
+    # Variants are generated in the background
+    return await run_in_threadpool(enqueue_image, file_path)
 
 
 @router.post("/images")
-def upload_images(
+async def upload_images(
     files: List[UploadFile] = File(...),
     current_user: User = Depends(get_current_moderator),
 ):
@@ -73,21 +176,49 @@ def upload_images(
             detail="Maximum 10 files allowed"
         )
 
-    uploaded_files = []
+    # Validate everything before writing anything
     for file in files:
         validate_image(file)
 
-        # Generate unique filename
-        ext = Path(file.filename).suffix.lower()
-        filename = f"{uuid.uuid4()}{ext}"
-        file_path = Path(settings.UPLOAD_DIR) / "images" / filename
-
-        # Save file
-        save_upload_file(file, file_path)
+    # Save all files concurrently, so the batch takes as long as its largest file
+    results = await asyncio.gather(
+        *(save_upload_file(file, upload_extension(file)) for file in files),
+        return_exceptions=True
+    )
+    saved = [result for result in results if not isinstance(result, Exception)]
+    errors = [result for result in results if isinstance(result, Exception)]
+    if not errors:
+        for file_path, _ in saved:
+            try:
+                await run_in_threadpool(check_image, file_path)
+            except HTTPException as e:
+                errors.append(e)
+                break
+    if errors:
+        # All or nothing: drop the files this batch created (not the deduplicated ones)
+        for file_path, created in saved:
+            if created:
+                file_path.unlink(missing_ok=True)
+        raise errors[0]
 
-        uploaded_files.append({
-            "filename": filename,
-            "url": f"/uploads/images/{filename}"
-        })
+    uploaded_files = []
+    for file_path, _ in saved:
+        uploaded_files.append(await run_in_threadpool(enqueue_image, file_path))
 
     return {"files": uploaded_files}
+
+
+@router.get("/image/{upload_id}")
+def get_image_status(
+    upload_id: str,
+    current_user: User = Depends(get_current_moderator),
+):
+    """Get processing status and variant URLs of an uploaded image (moderator/admin only)"""
+    if not UPLOAD_ID_RE.match(upload_id):
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    manifest = read_manifest(Path(settings.UPLOAD_DIR) / "images" / upload_id)
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    return {"id": upload_id, **manifest}
@@ -0,0 +1,185 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .config import settings
+from .conditional import compute_etag
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry TTL (values may be any object)"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+class RedisCacheBackend:
+    """Shared cache backed by Redis (requires the optional `redis` package)"""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._client.set(key, value, ex=ttl)
+
+    def get_counter(self, key: str) -> int:
+        value = self._client.get(key)
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str) -> int:
+        return self._client.incr(key)
+
+    def clear(self) -> None:
+        self._client.flushdb()
+
+
+class ResponseCache:
+    """Namespaced response cache.
+
+    Every namespace has a generation counter that is part of each key, so
+    invalidating a namespace is a single increment and stale entries simply
+    age out of the backend.
+    """
+
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    def make_key(self, namespace: str, path: str, query: str) -> str:
+        generation = self.backend.get_counter(f"cache-gen:{namespace}")
+        return f"cache:{namespace}:{generation}:{path}?{query}"
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, str], bytes]]:
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        headers, _, body = value.partition(b"\n")
+        return json.loads(headers), body
+
+    def set(self, key: str, headers: Dict[str, str], body: bytes) -> None:
+        self.backend.set(key, json.dumps(headers).encode("utf-8") + b"\n" + body, self.ttl)
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.backend.incr(f"cache-gen:{namespace}")
+
+
+def _create_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.RESPONSE_CACHE_URL)
+    return MemoryCacheBackend(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(_create_backend(), ttl=settings.RESPONSE_CACHE_TTL)
+
+
+# Column snapshots of authenticated users, keyed by user id (see crud.user)
+user_cache = MemoryCacheBackend(max_entries=settings.USER_CACHE_MAX_ENTRIES)
+
+
+def invalidate_cache(*namespaces: str) -> None:
+    """Drop cached responses of the given namespaces (called by CRUD write paths)"""
+    if settings.RESPONSE_CACHE_ENABLED:
+        response_cache.invalidate(*namespaces)
+
+
+# Response headers stored alongside cached bodies
+CACHED_HEADERS = ("content-type", "last-modified", "etag")
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """Serve successful GET responses of allow-listed public routes from the cache.
+
+    `routes` is a list of (path regex, namespace) pairs; only fully matching
+    paths are cached, so authenticated routes are never served from here.
+    """
+
+    def __init__(self, app, routes: List[Tuple[str, str]], cache: ResponseCache = response_cache):
+        super().__init__(app)
+        self.routes = [(re.compile(pattern), namespace) for pattern, namespace in routes]
+        self.cache = cache
+
+    def _namespace_for(self, path: str) -> Optional[str]:
+        for pattern, namespace in self.routes:
+            if pattern.fullmatch(path):
+                return namespace
+        return None
+
+    async def dispatch(self, request: Request, call_next):
+        namespace = self._namespace_for(request.url.path) if request.method == "GET" else None
+        if namespace is None:
+            return await call_next(request)
+
+        query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+        key = self.cache.make_key(namespace, request.url.path, query)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            headers, body = cached
+            headers["X-Cache"] = "HIT"
+            return Response(content=body, headers=headers)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = dict(response.headers)
+        # Compute the ETag once per cache fill rather than on every hit
+        headers.setdefault("etag", compute_etag(body))
+        self.cache.set(key, {name: headers[name] for name in CACHED_HEADERS if name in headers}, body)
+
+        headers["X-Cache"] = "MISS"
+        return Response(content=body, status_code=response.status_code, headers=headers)
@@ -0,0 +1,83 @@
+import hashlib
+import re
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Tuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore W/ prefixes
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def is_not_modified(request: Request, etag: Optional[str], last_modified: Optional[str]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since; If-None-Match takes precedence"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        return _not_modified_since(if_modified_since, last_modified)
+
+    return False
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """Add ETags to successful GET responses of allow-listed routes and answer
+    conditional requests with 304 Not Modified.
+
+    `routes` is a list of path regexes that must match the whole path.
+    """
+
+    def __init__(self, app, routes: List[str]):
+        super().__init__(app)
+        self.routes = [re.compile(pattern) for pattern in routes]
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET" or not any(p.fullmatch(request.url.path) for p in self.routes):
+            return await call_next(request)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        etag = response.headers.get("etag")
+        body: Optional[bytes] = None
+        if etag is None:
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            etag = compute_etag(body)
+
+        last_modified = response.headers.get("last-modified")
+        validators: List[Tuple[str, str]] = [("etag", etag), ("cache-control", "public, no-cache")]
+        if last_modified is not None:
+            validators.append(("last-modified", last_modified))
+
+        if is_not_modified(request, etag, last_modified):
+            return Response(status_code=304, headers=dict(validators))
+
+        if body is None:
+            response.headers["cache-control"] = "public, no-cache"
+            return response
+
+        headers = dict(response.headers)
+        headers.update(validators)
+        return Response(content=body, status_code=response.status_code, headers=headers)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 import os
 
 
@@ -10,11 +10,28 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Serve public read endpoints through the async engine (needs asyncpg / aiosqlite)
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None  # Derived from DATABASE_URL when not set
+
+    # Connection pool (None = per-dialect default, see app/core/pool.py)
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[int] = None  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: Optional[int] = None  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: Optional[bool] = None
 
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: str = "thread"  # "thread" or "process"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Beyond this, login/register answer 503
 
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -22,6 +39,33 @@ class Settings(BaseSettings):
     # Upload
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 1048576  # 1MB read/write chunks when saving uploads
+    IMAGE_QUALITY: int = 80  # WebP/JPEG quality of generated image variants
+
+    # Full-text search: "database" (PostgreSQL tsvector / SQLite FTS5) or "memory"
+    # (in-process index, only for single-process deployments since every worker keeps its own copy)
+    SEARCH_BACKEND: str = "database"
+    SEARCH_TS_CONFIG: str = "russian"  # PostgreSQL text search configuration
+    SEARCH_SNAPSHOT_PATH: str = "search_index.snapshot"  # memory backend snapshot, loaded at startup
+
+    # Background jobs (image processing)
+    JOB_QUEUE_BACKEND: str = "thread"  # "thread" (in-process), "inline" (synchronous) or "rq"
+    JOB_QUEUE_WORKERS: int = 2
+    JOB_QUEUE_URL: Optional[str] = None  # redis URL for the rq backend
+    IMAGE_JOB_TIMEOUT: int = 600  # seconds an upload may stay "pending" before its job is resubmitted
+
+    # Response cache for public read endpoints
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: str = "memory"  # "memory" (per process) or "redis" (shared)
+    RESPONSE_CACHE_URL: Optional[str] = None  # e.g. redis://localhost:6379/0
+    RESPONSE_CACHE_TTL: int = 60  # seconds
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+
+    # Authenticated-user cache (per process; also bounds how long role or
+    # is_active changes made by another worker take to apply)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL: int = 30  # seconds
+    USER_CACHE_MAX_ENTRIES: int = 10000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,162 @@
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .config import settings
+
+# Variant name -> maximum width in pixels (images are never upscaled)
+IMAGE_VARIANTS = {
+    "thumb": 320,
+    "card": 800,
+    "full": 1600,
+}
+
+# Output formats, preferred first; the first one is used for the plain "url"
+IMAGE_FORMATS = ["webp", "jpeg"]
+
+# Refuse to decode anything bigger than this (decompression bomb guard)
+Image.MAX_IMAGE_PIXELS = 50_000_000
+
+
+# Every file belonging to an upload (original, variants, manifest) starts with its id
+UPLOAD_FILE_RE = re.compile(
+    r"(?P<id>[A-Za-z0-9-]+?)(?:-(?:%s))?\.[A-Za-z0-9.]+" % "|".join(IMAGE_VARIANTS)
+)
+UPLOAD_URL_RE = re.compile(r"/uploads/images/(%s)" % UPLOAD_FILE_RE.pattern)
+
+
+class InvalidImage(ValueError):
+    """Raised when an upload cannot be decoded as an image"""
+
+
+def _prepare(image: Image.Image) -> Image.Image:
+    """Apply EXIF orientation, keep the first frame and drop all metadata"""
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+    image.info = {}
+    return image
+
+
+def _save(image: Image.Image, destination: Path, fmt: str) -> None:
+    if fmt == "jpeg":
+        if image.mode == "RGBA":
+            # JPEG has no alpha channel, flatten onto white
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        image.save(destination, "JPEG", quality=settings.IMAGE_QUALITY, optimize=True, progressive=True)
+    else:
+        image.save(destination, "WEBP", quality=settings.IMAGE_QUALITY, method=4)
+
+
+def probe_image(source: Path) -> None:
+    """Check that source is a decodable image by reading its header only"""
+    try:
+        with Image.open(source) as image:
+            image.size
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidImage(str(e)) from e
+
+
+def manifest_path(source: Path) -> Path:
+    """Path of the JSON file recording the processing state of an upload"""
+    return source.with_name(f"{source.stem}.json")
+
+
+def write_manifest(source: Path, data: Dict) -> None:
+    """Atomically write the processing state of an upload"""
+    path = manifest_path(source)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(data))
+    os.replace(tmp_path, path)
+
+
+def read_manifest(source: Path) -> Optional[Dict]:
+    """Read the processing state of an upload, or None if unknown"""
+    try:
+        return json.loads(manifest_path(source).read_text())
+    except FileNotFoundError:
+        return None
+
+
+def variant_filename(stem: str, variant: str, fmt: str) -> str:
+    """File name of one generated variant"""
+    ext = "jpg" if fmt == "jpeg" else fmt
+    return f"{stem}-{variant}.{ext}"
+
+
+def generate_variants(source: Path, url_prefix: str) -> Dict:
+    """Write the resized variants of source next to it and return their URLs and srcsets"""
+    try:
+        with Image.open(source) as original:
+            original.seek(0)
+            image = _prepare(original)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidImage(str(e)) from e
+
+    stem = source.stem
+    variants: Dict[str, Dict] = {}
+    written: Dict[int, str] = {}  # target width -> variant that already produced it
+
+    for name, max_width in IMAGE_VARIANTS.items():
+        width = min(max_width, image.width)
+        if width in written:
+            # Source is narrower than this variant, reuse the smaller one
+            variants[name] = variants[written[width]]
+            continue
+
+        resized = image
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.LANCZOS)
+
+        urls = {}
+        for fmt in IMAGE_FORMATS:
+            filename = variant_filename(stem, name, fmt)
+            _save(resized, source.parent / filename, fmt)
+            urls[fmt] = f"{url_prefix}/{filename}"
+
+        variants[name] = {"width": resized.width, "height": resized.height, **urls}
+        written[width] = name
+
+    srcset: Dict[str, str] = {}
+    for fmt in IMAGE_FORMATS:
+        entries: List[str] = []
+        for width, name in sorted(written.items()):
+            entries.append(f"{variants[name][fmt]} {width}w")
+        srcset[fmt] = ", ".join(entries)
+
+    return {
+        "url": variants["full"][IMAGE_FORMATS[0]],
+        "variants": variants,
+        "srcset": srcset,
+    }
+
+
+def process_upload(source_path: str, url_prefix: str) -> None:
+    """Background job: generate the variants of an upload and record the outcome"""
+    source = Path(source_path)
+    try:
+        processed = generate_variants(source, url_prefix)
+    except Exception as e:
+        write_manifest(source, {"status": "failed", "detail": str(e)})
+        return
+    write_manifest(source, {"status": "ready", **processed})
+
+
+def upload_id_from_name(filename: str) -> Optional[str]:
+    """Upload id of a file stored in the images directory"""
+    match = UPLOAD_FILE_RE.fullmatch(filename)
+    return match.group("id") if match else None
+
+
+def find_upload_ids(text: Optional[str]) -> Set[str]:
+    """Ids of all uploads referenced by URL in a text (cover path, editor JSON, ...)"""
+    if not text:
+        return set()
+    return {match.group("id") for match in UPLOAD_URL_RE.finditer(text)}
@@ -0,0 +1,73 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from .config import settings
+
+
+class ThreadJobQueue:
+    """In-process worker pool (default)"""
+
+    def __init__(self, workers: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jobs")
+
+    def submit(self, func: Callable, *args) -> None:
+        self._executor.submit(func, *args)
+
+    def shutdown(self) -> None:
+        # Let queued jobs finish so no upload is left without its manifest
+        self._executor.shutdown(wait=True)
+
+
+class InlineJobQueue:
+    """Runs jobs immediately in the caller (local stand-in for development and scripts)"""
+
+    def submit(self, func: Callable, *args) -> None:
+        func(*args)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class RQJobQueue:
+    """Jobs processed by separate `rq worker` processes (requires the optional `rq` package)"""
+
+    def __init__(self, url: str):
+        import redis
+        import rq
+
+        self._queue = rq.Queue("jobs", connection=redis.Redis.from_url(url))
+
+    def submit(self, func: Callable, *args) -> None:
+        self._queue.enqueue(func, *args)
+
+    def shutdown(self) -> None:
+        pass
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """Get the configured job queue, created on first use"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            if settings.JOB_QUEUE_BACKEND == "rq":
+                _job_queue = RQJobQueue(settings.JOB_QUEUE_URL)
+            elif settings.JOB_QUEUE_BACKEND == "inline":
+                _job_queue = InlineJobQueue()
+            else:
+                _job_queue = ThreadJobQueue(settings.JOB_QUEUE_WORKERS)
+        return _job_queue
+
+
+def shutdown_job_queue() -> None:
+    """Stop the job queue (called on application shutdown)"""
+    global _job_queue
+    with _job_queue_lock:
+        queue: Optional[object] = _job_queue
+        _job_queue = None
+    if queue is not None:
+        queue.shutdown()
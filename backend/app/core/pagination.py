@@ -0,0 +1,19 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(sort_value: datetime, item_id: int) -> str:
+    """Encode a (datetime, id) keyset position as an opaque URL-safe cursor"""
+    payload = json.dumps([sort_value.isoformat(), item_id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if it is malformed"""
+    try:
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(sort_value), int(item_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
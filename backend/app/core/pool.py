@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .config import settings
+
+# Defaults per dialect; SQLite connections are local files, so a small pool
+# without pre-ping or recycling is enough
+POOL_DEFAULTS = {
+    "sqlite": {"pool_size": 5, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": -1, "pool_pre_ping": False},
+    "postgresql": {"pool_size": 10, "max_overflow": 20, "pool_timeout": 10, "pool_recycle": 1800, "pool_pre_ping": True},
+}
+
+
+class PoolMetrics:
+    """Counters for connection checkouts, waits and timeouts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class _TimedCheckoutMixin:
+    """Measure how long each checkout waits for a connection"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def engine_pool_options(url: str, use_async: bool = False) -> Dict[str, Any]:
+    """Build create_engine pool arguments from settings and dialect defaults"""
+    dialect = url.split(":", 1)[0].split("+", 1)[0]
+    if dialect == "sqlite" and (use_async or ":memory:" in url or url.rstrip("/") == "sqlite:"):
+        # In-memory SQLite needs SQLAlchemy's single-connection pool, and pooled
+        # aiosqlite connections keep their worker threads alive, so keep the defaults
+        return {}
+
+    defaults = POOL_DEFAULTS.get(dialect, POOL_DEFAULTS["postgresql"])
+    configured = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    options = {key: defaults[key] if value is None else value for key, value in configured.items()}
+    options["poolclass"] = InstrumentedAsyncQueuePool if use_async else InstrumentedQueuePool
+    return options
+
+
+def pool_status(pool) -> Dict[str, Any]:
+    """Current pool occupancy plus checkout metrics"""
+    status: Dict[str, Any] = {"pool": pool.__class__.__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
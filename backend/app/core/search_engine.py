@@ -0,0 +1,287 @@
+"""In-process inverted index with BM25 ranking (search backend for single-process deployments)"""
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+from array import array
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .stemmers import stem_english, stem_russian
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+CYRILLIC_RE = re.compile(r"[а-яё]")
+
+STOPWORDS = {
+    # Russian
+    "и", "в", "во", "не", "что", "он", "на", "я", "с", "со", "как", "а", "то", "все", "она", "так", "его",
+    "но", "да", "ты", "к", "у", "же", "вы", "за", "бы", "по", "только", "ее", "мне", "было", "вот", "от",
+    "меня", "еще", "нет", "о", "из", "ему", "для", "при", "это", "этот", "эти", "или", "ли", "до", "их",
+    # English
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or",
+    "that", "the", "to", "was", "were", "will", "with", "this", "these", "those",
+}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Compact postings once this share of documents are deleted
+COMPACT_RATIO = 0.25
+COMPACT_MIN_DELETED = 1000
+
+SNAPSHOT_VERSION = 1
+
+
+@lru_cache(maxsize=200_000)
+def _term(token: str) -> Optional[str]:
+    """Index term of a lowercase token (None for stopwords); cached since vocabularies are small"""
+    if token in STOPWORDS or (len(token) < 2 and not token.isdigit()):
+        return None
+    if CYRILLIC_RE.search(token):
+        return stem_russian(token)
+    if token.isascii() and token.isalpha():
+        return stem_english(token)
+    return token
+
+
+def analyze(text: str) -> List[str]:
+    """Lowercase, split, drop stopwords and stem Russian/English words"""
+    return [term for term in map(_term, TOKEN_RE.findall(text.lower())) if term is not None]
+
+
+class _Postings:
+    """Posting list of one term: delta-encoded document numbers and term frequencies"""
+    __slots__ = ("deltas", "freqs", "last")
+
+    def __init__(self):
+        self.deltas = array("I")
+        self.freqs = array("H")
+        self.last = 0
+
+    def append(self, docno: int, freq: int) -> None:
+        # Document numbers only grow, so every delta is positive
+        self.deltas.append(docno - self.last)
+        self.freqs.append(min(freq, 0xFFFF))
+        self.last = docno
+
+    def __iter__(self):
+        return zip(accumulate(self.deltas), self.freqs)
+
+
+class InvertedIndex:
+    """Append-only inverted index; updates re-add a document under a new number and tombstone the old one"""
+
+    def __init__(self, field_weights: Dict[str, int]):
+        self.field_weights = field_weights
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.postings: Dict[str, _Postings] = {}
+        # Document 0 is never used so that every delta is >= 1
+        self.doc_keys: List[Optional[Hashable]] = [None]
+        self.doc_lengths = array("I", [0])
+        self.stored: Dict[int, Dict[str, Any]] = {}
+        self.key_to_docno: Dict[Hashable, int] = {}
+        self.total_length = 0
+        self.deleted = 0
+
+    def __len__(self) -> int:
+        return len(self.key_to_docno)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def add(self, key: Hashable, fields: Dict[str, str], stored: Dict[str, Any]) -> None:
+        """Index (or re-index) a document; field texts are weighted by field_weights"""
+        freqs: Counter = Counter()
+        for field, weight in self.field_weights.items():
+            for term in analyze(fields.get(field) or ""):
+                freqs[term] += weight
+        length = sum(freqs.values())
+
+        with self._lock:
+            self._remove(key)
+            docno = len(self.doc_keys)
+            self.doc_keys.append(key)
+            self.doc_lengths.append(length)
+            self.stored[docno] = stored
+            self.key_to_docno[key] = docno
+            self.total_length += length
+            for term, freq in freqs.items():
+                postings = self.postings.get(term)
+                if postings is None:
+                    postings = self.postings[term] = _Postings()
+                postings.append(docno, freq)
+            # Re-indexing tombstones the old slot, so an index that only sees edits grows too
+            self._maybe_compact()
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+            self._maybe_compact()
+
+    def _remove(self, key: Hashable) -> None:
+        docno = self.key_to_docno.pop(key, None)
+        if docno is None:
+            return
+        self.doc_keys[docno] = None
+        self.stored.pop(docno, None)
+        self.total_length -= self.doc_lengths[docno]
+        self.deleted += 1
+
+    def _maybe_compact(self) -> None:
+        if self.deleted >= COMPACT_MIN_DELETED and self.deleted > COMPACT_RATIO * len(self.doc_keys):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Renumber live documents densely and drop tombstoned postings"""
+        renumber = {}
+        doc_keys: List[Optional[Hashable]] = [None]
+        doc_lengths = array("I", [0])
+        for docno, key in enumerate(self.doc_keys):
+            if key is not None:
+                renumber[docno] = len(doc_keys)
+                doc_keys.append(key)
+                doc_lengths.append(self.doc_lengths[docno])
+
+        postings: Dict[str, _Postings] = {}
+        for term, old in self.postings.items():
+            new = None
+            for docno, freq in old:
+                if docno in renumber:
+                    if new is None:
+                        new = _Postings()
+                    new.append(renumber[docno], freq)
+            if new is not None:
+                postings[term] = new
+
+        self.postings = postings
+        self.doc_keys = doc_keys
+        self.doc_lengths = doc_lengths
+        self.stored = {renumber[docno]: data for docno, data in self.stored.items()}
+        self.key_to_docno = {key: renumber[docno] for key, docno in self.key_to_docno.items()}
+        self.deleted = 0
+
+    def search(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: int = 20,
+        where: Optional[Dict[str, Any]] = None,
+        sort_key: Optional[str] = None
+    ) -> Tuple[List[Tuple[Dict[str, Any], float]], int]:
+        """BM25-ranked documents containing every query term; returns (stored, score) pairs and the total"""
+        terms = list(dict.fromkeys(analyze(query)))
+        if not terms:
+            return [], 0
+
+        with self._lock:
+            live = len(self.key_to_docno)
+            if not live:
+                return [], 0
+            avg_length = self.total_length / live
+
+            # Walk the rarest term first so the candidate set starts small
+            term_postings = []
+            for term in terms:
+                postings = self.postings.get(term)
+                if postings is None:
+                    return [], 0
+                term_postings.append(postings)
+            term_postings.sort(key=lambda postings: len(postings.deltas))
+
+            # BM25 length normalisation: k1 * (1 - b + b * length / avg_length)
+            norm_base = BM25_K1 * (1 - BM25_B)
+            norm_scale = BM25_K1 * BM25_B / avg_length
+            lengths = self.doc_lengths
+
+            scores: Optional[Dict[int, float]] = None
+            for postings in term_postings:
+                if self.deleted:
+                    matches = [(docno, freq) for docno, freq in postings if self.doc_keys[docno] is not None]
+                else:
+                    matches = list(postings)
+                idf = math.log(1 + (live - len(matches) + 0.5) / (len(matches) + 0.5))
+                boost = idf * (BM25_K1 + 1)
+                if scores is not None:
+                    matches = [(docno, freq) for docno, freq in matches if docno in scores]
+                term_scores = {
+                    docno: boost * freq / (freq + norm_base + norm_scale * lengths[docno])
+                    for docno, freq in matches
+                }
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {docno: scores[docno] + score for docno, score in term_scores.items()}
+                if not scores:
+                    return [], 0
+
+            if where:
+                scores = {
+                    docno: score for docno, score in scores.items()
+                    if all(self.stored[docno].get(field) == value for field, value in where.items())
+                }
+
+            def rank(item):
+                docno, score = item
+                return score, (self.stored[docno].get(sort_key) or "") if sort_key else docno
+
+            top = heapq.nlargest(skip + limit, scores.items(), key=rank)[skip:]
+            return [(self.stored[docno], score) for docno, score in top], len(scores)
+
+    def save(self, path: str, fingerprint: Any = None) -> None:
+        """Write a snapshot atomically (postings arrays are stored as raw bytes, tombstones included)"""
+        with self._lock:
+            data = {
+                "version": SNAPSHOT_VERSION,
+                "fingerprint": fingerprint,
+                "field_weights": self.field_weights,
+                "postings": {
+                    term: (postings.deltas.tobytes(), postings.freqs.tobytes(), postings.last)
+                    for term, postings in self.postings.items()
+                },
+                "doc_keys": self.doc_keys,
+                "doc_lengths": self.doc_lengths.tobytes(),
+                "stored": self.stored,
+                "total_length": self.total_length,
+                "deleted": self.deleted,
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> Any:
+        """Load a snapshot written by save; returns its fingerprint (raises ValueError if unusable)"""
+        with open(path, "rb") as file:
+            data = pickle.load(file)
+        if data.get("version") != SNAPSHOT_VERSION or data.get("field_weights") != self.field_weights:
+            raise ValueError("Incompatible search snapshot")
+
+        postings = {}
+        for term, (deltas, freqs, last) in data["postings"].items():
+            entry = _Postings()
+            entry.deltas.frombytes(deltas)
+            entry.freqs.frombytes(freqs)
+            entry.last = last
+            postings[term] = entry
+
+        doc_lengths = array("I")
+        doc_lengths.frombytes(data["doc_lengths"])
+
+        with self._lock:
+            self.postings = postings
+            self.doc_keys = data["doc_keys"]
+            self.doc_lengths = doc_lengths
+            self.stored = data["stored"]
+            self.key_to_docno = {key: docno for docno, key in enumerate(self.doc_keys) if key is not None}
+            self.total_length = data["total_length"]
+            self.deleted = data["deleted"]
+        return data["fingerprint"]
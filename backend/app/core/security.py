@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Any
 from jose import jwt
@@ -5,6 +8,10 @@ import bcrypt
 from .config import settings
 
 
+class PasswordHashingBusy(Exception):
+    """Raised when too many password hash jobs are already queued"""
+
+
 def create_access_token(subject: str | Any, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     if expires_delta:
@@ -24,6 +31,71 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a bcrypt hash was made with a cost other than BCRYPT_ROUNDS"""
+    # bcrypt hashes look like $2b$<cost>$<salt+hash>
+    try:
+        cost = int(hashed_password.split('$')[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != settings.BCRYPT_ROUNDS
+
+
+# Dedicated executor for bcrypt work, so bursts of logins cannot occupy the
+# threadpool that serves every other sync endpoint
+_password_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+_pending_jobs = 0
+
+
+def _get_password_executor() -> Executor:
+    global _password_executor
+    with _executor_lock:
+        if _password_executor is None:
+            if settings.PASSWORD_HASH_EXECUTOR == "process":
+                _password_executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+            else:
+                _password_executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    thread_name_prefix="password-hash"
+                )
+        return _password_executor
+
+
+async def _run_password_job(func, *args):
+    global _pending_jobs
+    with _executor_lock:
+        if _pending_jobs >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise PasswordHashingBusy()
+        _pending_jobs += 1
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_password_executor(), func, *args)
+    finally:
+        with _executor_lock:
+            _pending_jobs -= 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the dedicated password executor"""
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the dedicated password executor"""
+    return await _run_password_job(get_password_hash, password)
+
+
+def shutdown_password_executor() -> None:
+    """Stop the password executor (called on application shutdown)"""
+    global _password_executor
+    with _executor_lock:
+        if _password_executor is not None:
+            _password_executor.shutdown(wait=False, cancel_futures=True)
+            _password_executor = None
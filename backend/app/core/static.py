@@ -0,0 +1,196 @@
+import os
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from .images import IMAGE_VARIANTS
+
+# Upload names never change content (content hash or uuid), so browsers may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Processing manifests are rewritten in place
+MUTABLE_CACHE_CONTROL = "no-cache"
+MUTABLE_SUFFIXES = {".json"}
+
+# Precompressed siblings looked up for compressible types, preferred first
+PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+
+VARIANT_SUFFIXES = tuple(f"-{name}" for name in IMAGE_VARIANTS)
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when a Range header lies outside the file"""
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single `bytes=` range into inclusive (start, end); None means serve everything"""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        # Unknown units and multipart ranges fall back to the full body
+        return None
+
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        start = int(start_text) if start_text else None
+        end = int(end_text) if end_text else None
+    except ValueError:
+        return None
+
+    if start is None:
+        # Suffix range: the last N bytes
+        if not end:
+            raise RangeNotSatisfiable()
+        start, end = max(size - end, 0), size - 1
+    elif end is None:
+        end = size - 1
+
+    if start >= size or start > end:
+        raise RangeNotSatisfiable()
+    return start, min(end, size - 1)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+class RangeFileResponse(FileResponse):
+    """FileResponse that can serve one byte range, via zero-copy when the server offers it"""
+
+    chunk_size = 256 * 1024
+
+    def __init__(self, *args, byte_range: Optional[Tuple[int, int]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.byte_range = byte_range
+        if byte_range is not None:
+            start, end = byte_range
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {start}-{end}/{self.stat_result.st_size}"
+            self.headers["content-length"] = str(end - start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if self.send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        start, end = self.byte_range or (0, self.stat_result.st_size - 1)
+        remaining = end - start + 1
+
+        if "http.response.zerocopy" in scope.get("extensions", {}):
+            # The server copies straight from the file descriptor (sendfile)
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": file.fileno(),
+                    "offset": start,
+                    "count": remaining,
+                    "more_body": False,
+                })
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            if start:
+                await file.seek(start)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            # File shrank underneath us, close the body anyway
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class UploadStaticFiles(StaticFiles):
+    """StaticFiles for uploads: immutable caching, name-based ETags, ranges and negotiated variants"""
+
+    def _negotiate(self, full_path: Path, request_headers: Headers) -> Tuple[Path, Optional[str], bool]:
+        """Pick the file to send: WebP instead of a JPEG variant, or a precompressed sibling"""
+        accept = request_headers.get("accept", "")
+        if full_path.suffix == ".jpg" and full_path.stem.endswith(VARIANT_SUFFIXES):
+            webp_path = full_path.with_suffix(".webp")
+            if "image/webp" in accept and webp_path.is_file():
+                return webp_path, None, True
+            return full_path, None, True
+
+        media_type = guess_type(full_path.name)[0] or ""
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            accept_encoding = request_headers.get("accept-encoding", "")
+            for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+                compressed_path = full_path.with_name(full_path.name + suffix)
+                if encoding in accept_encoding and compressed_path.is_file():
+                    return compressed_path, encoding, True
+        return full_path, None, False
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = Path(full_path)
+        served_path, encoding, negotiated = self._negotiate(full_path, request_headers)
+        if served_path != full_path:
+            stat_result = os.stat(served_path)
+
+        mutable = full_path.suffix in MUTABLE_SUFFIXES
+        if mutable:
+            etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        else:
+            # The name already identifies the content, no hashing needed
+            etag = f'"{served_path.name}"'
+
+        headers = {
+            "etag": etag,
+            "accept-ranges": "bytes",
+            "cache-control": MUTABLE_CACHE_CONTROL if mutable else IMMUTABLE_CACHE_CONTROL,
+        }
+        if negotiated:
+            headers["vary"] = "Accept-Encoding" if encoding else "Accept"
+        if encoding:
+            headers["content-encoding"] = encoding
+
+        if status_code == 200:
+            if_none_match = request_headers.get("if-none-match")
+            if if_none_match is not None and etag_matches(if_none_match, etag):
+                return NotModifiedResponse(Headers(headers))
+            if if_none_match is None and not mutable and "if-modified-since" in request_headers:
+                # Immutable files never change after being written
+                return NotModifiedResponse(Headers(headers))
+
+        byte_range = None
+        range_header = request_headers.get("range")
+        if status_code == 200 and range_header and not encoding:
+            if_range = request_headers.get("if-range")
+            if if_range is None or if_range == etag:
+                try:
+                    byte_range = parse_range(range_header, stat_result.st_size)
+                except RangeNotSatisfiable:
+                    return Response(
+                        status_code=416,
+                        headers={"content-range": f"bytes */{stat_result.st_size}", **headers}
+                    )
+
+        return RangeFileResponse(
+            served_path,
+            status_code=status_code,
+            headers=headers,
+            # A precompressed file keeps the type of the original, a negotiated WebP has its own
+            media_type=guess_type(full_path.name if encoding else served_path.name)[0] or "application/octet-stream",
+            stat_result=stat_result,
+            method=scope["method"],
+            byte_range=byte_range,
+        )
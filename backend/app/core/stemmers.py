@@ -0,0 +1,286 @@
+"""Snowball stemmers for Russian and English (pure Python)"""
+from typing import Iterable, Optional, Tuple
+
+
+# Russian (https://snowballstem.org/algorithms/russian/stemmer.html)
+
+RU_VOWELS = set("аеиоуыэюя")
+
+RU_PERFECTIVE_GERUND = (("вшись", "вши", "в"), ("ившись", "ывшись", "ивши", "ывши", "ив", "ыв"))
+RU_ADJECTIVE = (
+    "ими", "ыми", "его", "ого", "ему", "ому",
+    "ее", "ие", "ые", "ое", "ей", "ий", "ый", "ой", "ем", "им", "ым", "ом",
+    "их", "ых", "ую", "юю", "ая", "яя", "ою", "ею",
+)
+RU_PARTICIPLE = (("ем", "нн", "вш", "ющ", "щ"), ("ивш", "ывш", "ующ"))
+RU_REFLEXIVE = ("ся", "сь")
+RU_VERB = (
+    ("ете", "йте", "ешь", "нно", "ла", "на", "ли", "ем", "ло", "но", "ет", "ют", "ны", "ть", "й", "л", "н"),
+    (
+        "ейте", "уйте", "ила", "ыла", "ена", "ите", "или", "ыли", "ило", "ыло", "ено", "ует", "уют",
+        "ены", "ить", "ыть", "ишь", "ей", "уй", "ил", "ыл", "им", "ым", "ен", "ят", "ит", "ыт", "ую", "ю",
+    ),
+)
+RU_NOUN = (
+    "иями", "ями", "ами", "ией", "иям", "ием", "иях",
+    "ев", "ов", "ие", "ье", "еи", "ии", "ей", "ой", "ий", "ям", "ем", "ам", "ом", "ах", "ях", "ию", "ью", "ия", "ья",
+    "а", "е", "и", "й", "о", "у", "ы", "ь", "ю", "я",
+)
+RU_SUPERLATIVE = ("ейше", "ейш")
+RU_DERIVATIONAL = ("ость", "ост")
+
+
+def _by_length(endings: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sorted(endings, key=len, reverse=True))
+
+
+RU_PERFECTIVE_GERUND = tuple(_by_length(group) for group in RU_PERFECTIVE_GERUND)
+RU_ADJECTIVE = _by_length(RU_ADJECTIVE)
+RU_PARTICIPLE = tuple(_by_length(group) for group in RU_PARTICIPLE)
+RU_VERB = tuple(_by_length(group) for group in RU_VERB)
+RU_NOUN = _by_length(RU_NOUN)
+
+
+def _ru_regions(word: str) -> Tuple[int, int]:
+    """Start offsets of RV and R2"""
+    rv = len(word)
+    for i, char in enumerate(word):
+        if char in RU_VOWELS:
+            rv = i + 1
+            break
+
+    def next_region(start: int) -> int:
+        for i in range(start + 1, len(word)):
+            if word[i] not in RU_VOWELS and word[i - 1] in RU_VOWELS:
+                return i + 1
+        return len(word)
+
+    r1 = next_region(0)
+    return rv, next_region(r1)
+
+
+def _ru_strip_grouped(rv: str, groups) -> Optional[str]:
+    """Remove the longest ending; first-group endings must follow а or я"""
+    first, second = groups
+    best = None
+    for ending in first:
+        if rv.endswith(ending) and len(rv) > len(ending) and rv[-len(ending) - 1] in "ая":
+            best = ending
+            break
+    for ending in second:
+        if rv.endswith(ending) and (best is None or len(ending) > len(best)):
+            best = ending
+            break
+    return rv[:-len(best)] if best else None
+
+
+def _ru_strip(rv: str, endings: Tuple[str, ...]) -> Optional[str]:
+    for ending in endings:
+        if rv.endswith(ending):
+            return rv[:-len(ending)]
+    return None
+
+
+def stem_russian(word: str) -> str:
+    """Stem a lowercase Russian word"""
+    word = word.replace("ё", "е")
+    rv_start, r2_start = _ru_regions(word)
+    prefix, rv = word[:rv_start], word[rv_start:]
+
+    # Step 1
+    stripped = _ru_strip_grouped(rv, RU_PERFECTIVE_GERUND)
+    if stripped is not None:
+        rv = stripped
+    else:
+        reflexive = _ru_strip(rv, RU_REFLEXIVE)
+        if reflexive is not None:
+            rv = reflexive
+        adjective = _ru_strip(rv, RU_ADJECTIVE)
+        if adjective is not None:
+            # An adjectival ending may carry a participle suffix in front of it
+            participle = _ru_strip_grouped(adjective, RU_PARTICIPLE)
+            rv = adjective if participle is None else participle
+        else:
+            stripped = _ru_strip_grouped(rv, RU_VERB)
+            if stripped is None:
+                stripped = _ru_strip(rv, RU_NOUN)
+            if stripped is not None:
+                rv = stripped
+
+    # Step 2
+    if rv.endswith("и"):
+        rv = rv[:-1]
+
+    # Step 3: derivational ending inside R2
+    r2_in_rv = max(r2_start - rv_start, 0)
+    for ending in RU_DERIVATIONAL:
+        if rv.endswith(ending) and len(rv) - len(ending) >= r2_in_rv:
+            rv = rv[:-len(ending)]
+            break
+
+    # Step 4
+    if rv.endswith("нн"):
+        rv = rv[:-1]
+    else:
+        superlative = _ru_strip(rv, RU_SUPERLATIVE)
+        if superlative is not None:
+            rv = superlative[:-1] if superlative.endswith("нн") else superlative
+        elif rv.endswith("ь"):
+            rv = rv[:-1]
+
+    return prefix + rv
+
+
+# English (Porter2, https://snowballstem.org/algorithms/english/stemmer.html)
+
+EN_VOWELS = set("aeiouy")
+EN_DOUBLES = ("bb", "dd", "ff", "gg", "mm", "nn", "pp", "rr", "tt")
+EN_LI_ENDING = set("cdeghkmnrt")
+
+EN_STEP2 = sorted([
+    ("ational", "ate"), ("tional", "tion"), ("enci", "ence"), ("anci", "ance"), ("abli", "able"),
+    ("entli", "ent"), ("izer", "ize"), ("ization", "ize"), ("ation", "ate"), ("ator", "ate"),
+    ("alism", "al"), ("aliti", "al"), ("alli", "al"), ("fulness", "ful"), ("ousli", "ous"),
+    ("ousness", "ous"), ("iveness", "ive"), ("iviti", "ive"), ("biliti", "ble"), ("bli", "ble"),
+    ("fulli", "ful"), ("lessli", "less"), ("ogi", "og"), ("li", ""),
+], key=lambda pair: len(pair[0]), reverse=True)
+EN_STEP3 = sorted([
+    ("ational", "ate"), ("tional", "tion"), ("alize", "al"), ("icate", "ic"), ("iciti", "ic"),
+    ("ical", "ic"), ("ful", ""), ("ness", ""), ("ative", ""),
+], key=lambda pair: len(pair[0]), reverse=True)
+EN_STEP4 = _by_length([
+    "al", "ance", "ence", "er", "ic", "able", "ible", "ant", "ement", "ment", "ent",
+    "ism", "ate", "iti", "ous", "ive", "ize", "ion",
+])
+EN_EXCEPTIONS = {
+    "skis": "ski", "skies": "sky", "dying": "die", "lying": "lie", "tying": "tie",
+    "idly": "idl", "gently": "gentl", "ugly": "ugli", "early": "earli", "only": "onli", "singly": "singl",
+    "sky": "sky", "news": "news", "howe": "howe", "atlas": "atlas", "cosmos": "cosmos", "bias": "bias", "andes": "andes",
+}
+
+
+def _en_regions(word: str) -> Tuple[int, int]:
+    def next_region(start: int) -> int:
+        for i in range(start + 1, len(word)):
+            if word[i] not in EN_VOWELS and word[i - 1] in EN_VOWELS:
+                return i + 1
+        return len(word)
+
+    for prefix in ("gener", "commun", "arsen"):
+        if word.startswith(prefix):
+            r1 = len(prefix)
+            break
+    else:
+        r1 = next_region(0)
+    return r1, next_region(r1)
+
+
+def _en_short_syllable_end(word: str) -> bool:
+    if len(word) == 2:
+        return word[0] in EN_VOWELS and word[1] not in EN_VOWELS
+    return (
+        len(word) > 2
+        and word[-3] not in EN_VOWELS
+        and word[-2] in EN_VOWELS
+        and word[-1] not in EN_VOWELS
+        and word[-1] not in "wxY"
+    )
+
+
+def stem_english(word: str) -> str:
+    """Stem a lowercase English word"""
+    if len(word) <= 2:
+        return word
+    if word in EN_EXCEPTIONS:
+        return EN_EXCEPTIONS[word]
+
+    word = word.lstrip("'")
+    if word.startswith("y"):
+        word = "Y" + word[1:]
+    word = "".join(
+        "Y" if char == "y" and i > 0 and word[i - 1] in EN_VOWELS else char
+        for i, char in enumerate(word)
+    )
+    r1, r2 = _en_regions(word)
+
+    # Step 0
+    for suffix in ("'s'", "'s", "'"):
+        if word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+
+    # Step 1a
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith(("ied", "ies")):
+        word = word[:-2] if len(word) > 4 else word[:-1]
+    elif word.endswith(("us", "ss")):
+        pass
+    elif word.endswith("s") and any(char in EN_VOWELS for char in word[:-2]):
+        word = word[:-1]
+
+    # Step 1b
+    for suffix in ("eedly", "eed"):
+        if word.endswith(suffix):
+            if len(word) - len(suffix) >= r1:
+                word = word[:-len(suffix)] + "ee"
+            break
+    else:
+        for suffix in ("ingly", "edly", "ing", "ed"):
+            if word.endswith(suffix):
+                stem = word[:-len(suffix)]
+                if any(char in EN_VOWELS for char in stem):
+                    word = stem
+                    if word.endswith(("at", "bl", "iz")):
+                        word += "e"
+                    elif word.endswith(EN_DOUBLES):
+                        word = word[:-1]
+                    elif r1 >= len(word) and _en_short_syllable_end(word):
+                        word += "e"
+                break
+
+    # Step 1c
+    if len(word) > 2 and word[-1] in "yY" and word[-2] not in EN_VOWELS:
+        word = word[:-1] + "i"
+
+    # Step 2
+    for suffix, replacement in EN_STEP2:
+        if word.endswith(suffix):
+            if len(word) - len(suffix) >= r1:
+                if suffix == "ogi":
+                    if word[-4:-3] == "l":
+                        word = word[:-len(suffix)] + replacement
+                elif suffix == "li":
+                    if word[-3:-2] and word[-3] in EN_LI_ENDING:
+                        word = word[:-2]
+                else:
+                    word = word[:-len(suffix)] + replacement
+            break
+
+    # Step 3
+    for suffix, replacement in EN_STEP3:
+        if word.endswith(suffix):
+            if len(word) - len(suffix) >= r1 and (suffix != "ative" or len(word) - len(suffix) >= r2):
+                word = word[:-len(suffix)] + replacement
+            break
+
+    # Step 4
+    for suffix in EN_STEP4:
+        if word.endswith(suffix):
+            if len(word) - len(suffix) >= r2:
+                if suffix == "ion":
+                    if word[-4:-3] in ("s", "t"):
+                        word = word[:-3]
+                else:
+                    word = word[:-len(suffix)]
+            break
+
+    # Step 5
+    if word.endswith("e"):
+        stem = word[:-1]
+        if len(stem) >= r2 or (len(stem) >= r1 and not _en_short_syllable_end(stem)):
+            word = stem
+    elif word.endswith("l") and len(word) - 1 >= r2 and word.endswith("ll"):
+        word = word[:-1]
+
+    return word.replace("Y", "y")
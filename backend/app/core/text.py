@@ -0,0 +1,107 @@
+import json
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+# Tags whose content is never visible text
+SKIPPED_TAGS = {"script", "style"}
+# Tags that separate words even without surrounding whitespace
+BLOCK_TAGS = {"p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "tr", "td", "th"}
+
+WHITESPACE_RE = re.compile(r"\s+")
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Average silent reading speed, words per minute
+READING_WORDS_PER_MINUTE = 200
+AUTO_EXCERPT_LENGTH = 200
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _collect_json_text(node, parts: List[str]) -> None:
+    """Walk an editor (ProseMirror/TipTap) JSON document collecting its text nodes"""
+    if isinstance(node, dict):
+        if isinstance(node.get("text"), str):
+            parts.append(node["text"])
+        for child in node.get("content") or []:
+            _collect_json_text(child, parts)
+        if node.get("type") not in (None, "text"):
+            parts.append(" ")
+    elif isinstance(node, list):
+        for child in node:
+            _collect_json_text(child, parts)
+
+
+def extract_text(content: Optional[str]) -> str:
+    """Plain text of stored editor content (JSON document or HTML)"""
+    if not content:
+        return ""
+
+    parts: List[str] = []
+    stripped = content.lstrip()
+    if stripped.startswith(("{", "[")):
+        try:
+            _collect_json_text(json.loads(stripped), parts)
+        except ValueError:
+            parts = []
+
+    if not parts:
+        extractor = _TextExtractor()
+        extractor.feed(content)
+        extractor.close()
+        parts = extractor.parts
+
+    return WHITESPACE_RE.sub(" ", "".join(parts)).strip()
+
+
+def truncate_text(text: str, length: int) -> str:
+    """Cut text at a word boundary, adding an ellipsis when shortened"""
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def count_words(text: str) -> int:
+    """Number of words in plain text"""
+    return len(WORD_RE.findall(text))
+
+
+def reading_time(word_count: int) -> int:
+    """Estimated reading time in whole minutes (at least 1 for non-empty text)"""
+    if not word_count:
+        return 0
+    return max(1, round(word_count / READING_WORDS_PER_MINUTE))
+
+
+def summarize_content(content: Optional[str]) -> Dict[str, Any]:
+    """Derived text fields of editor content: plain_text, word_count, reading_time, auto_excerpt"""
+    plain_text = extract_text(content)
+    word_count = count_words(plain_text)
+    return {
+        "plain_text": plain_text,
+        "word_count": word_count,
+        "reading_time": reading_time(word_count),
+        "auto_excerpt": truncate_text(plain_text, AUTO_EXCERPT_LENGTH),
+    }
@@ -1,20 +1,67 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from collections import Counter
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from ..models.announcement import Announcement, AnnouncementStatus
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import desc, and_, or_, exists
+from ..models.announcement import Announcement, AnnouncementStatus, announcement_categories
 from ..models.category import Category
+from ..models.employee import Employee
+from ..core.cache import invalidate_cache
+from ..core.text import summarize_content
+from . import search as crud_search
+from . import category as crud_category
+from . import organization as crud_organization
 from ..schemas.announcement import AnnouncementCreate, AnnouncementUpdate
 
 
+def _list_load_options() -> list:
+    """Loader options for relationships serialized by AnnouncementList"""
+    return [
+        joinedload(Announcement.author),
+        selectinload(Announcement.categories)
+    ]
+
+
+def _detail_load_options() -> list:
+    """Loader options for relationships serialized by the full Announcement schema"""
+    return _list_load_options() + [
+        joinedload(Announcement.organization),
+        joinedload(Announcement.employee).joinedload(Employee.user),
+        joinedload(Announcement.employee).joinedload(Employee.organization)
+    ]
+
+
+def _category_filter(category_ids: List[int], match: str = "any"):
+    """EXISTS filter on announcement_categories: any of the categories, or all of them with match="all"
+
+    A semi-join never duplicates announcement rows, so ordering and pagination stay intact.
+    """
+    if match == "all":
+        return and_(*(
+            exists().where(
+                announcement_categories.c.announcement_id == Announcement.id,
+                announcement_categories.c.category_id == category_id
+            )
+            for category_id in set(category_ids)
+        ))
+    return exists().where(
+        announcement_categories.c.announcement_id == Announcement.id,
+        announcement_categories.c.category_id.in_(category_ids)
+    )
+
+
 def get_announcement(db: Session, announcement_id: int) -> Optional[Announcement]:
     """Get announcement by ID"""
-    return db.query(Announcement).filter(Announcement.id == announcement_id).first()
+    return db.query(Announcement).options(
+        *_detail_load_options()
+    ).filter(Announcement.id == announcement_id).first()
 
 
 def get_announcement_by_slug(db: Session, slug: str) -> Optional[Announcement]:
     """Get announcement by slug"""
-    return db.query(Announcement).filter(Announcement.slug == slug).first()
+    return db.query(Announcement).options(
+        *_detail_load_options()
+    ).filter(Announcement.slug == slug).first()
 
 
 def get_announcements(
@@ -22,36 +69,115 @@ def get_announcements(
     skip: int = 0,
     limit: int = 100,
     status: Optional[AnnouncementStatus] = None,
-    category_id: Optional[int] = None
+    category_ids: Optional[List[int]] = None,
+    category_match: str = "any"
 ) -> List[Announcement]:
     """Get list of announcements with optional filters"""
-    query = db.query(Announcement)
+    query = db.query(Announcement).options(*_list_load_options())
 
     if status:
         query = query.filter(Announcement.status == status)
 
-    if category_id:
-        query = query.join(Announcement.categories).filter(Category.id == category_id)
+    if category_ids:
+        query = query.filter(_category_filter(category_ids, category_match))
 
     return query.order_by(desc(Announcement.created_at)).offset(skip).limit(limit).all()
 
 
-def get_published_announcements(db: Session, skip: int = 0, limit: int = 100) -> List[Announcement]:
+def get_published_announcements(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    category_ids: Optional[List[int]] = None,
+    category_match: str = "any"
+) -> List[Announcement]:
     """Get published announcements only"""
-    return (
+    query = (
         db.query(Announcement)
+        .options(*_list_load_options())
         .filter(Announcement.status == AnnouncementStatus.PUBLISHED)
-        .order_by(desc(Announcement.published_at))
+    )
+
+    if category_ids:
+        query = query.filter(_category_filter(category_ids, category_match))
+
+    return (
+        query.order_by(desc(Announcement.published_at), desc(Announcement.id))
         .offset(skip)
         .limit(limit)
         .all()
     )
 
 
+def get_published_announcements_after(
+    db: Session,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    limit: int = 20,
+    category_ids: Optional[List[int]] = None,
+    category_match: str = "any"
+) -> List[Announcement]:
+    """Get published announcements after a (published_at, id) keyset position, newest first"""
+    query = (
+        db.query(Announcement)
+        .options(*_list_load_options())
+        .filter(
+            Announcement.status == AnnouncementStatus.PUBLISHED,
+            Announcement.published_at.isnot(None)
+        )
+    )
+
+    if category_ids:
+        query = query.filter(_category_filter(category_ids, category_match))
+
+    if cursor:
+        published_at, announcement_id = cursor
+        query = query.filter(or_(
+            Announcement.published_at < published_at,
+            and_(Announcement.published_at == published_at, Announcement.id < announcement_id)
+        ))
+
+    return (
+        query.order_by(desc(Announcement.published_at), desc(Announcement.id))
+        .limit(limit)
+        .all()
+    )
+
+
+def _apply_content_summary(db_announcement: Announcement) -> None:
+    """Store plain text, word count, reading time and auto-excerpt derived from content"""
+    for field, value in summarize_content(db_announcement.content).items():
+        setattr(db_announcement, field, value)
+
+
+def _feed_membership(db_announcement: Announcement) -> Tuple[List[int], Optional[int]]:
+    """Categories and organization whose published counters include this announcement"""
+    if db_announcement.status != AnnouncementStatus.PUBLISHED:
+        return [], None
+    return [category.id for category in db_announcement.categories], db_announcement.organization_id
+
+
+def _update_feed_counts(
+    db: Session,
+    before: Tuple[List[int], Optional[int]],
+    after: Tuple[List[int], Optional[int]]
+) -> None:
+    """Move the announcement's counter contributions from `before` to `after` membership"""
+    category_deltas = Counter(after[0])
+    category_deltas.subtract(before[0])
+    crud_category.adjust_announcements_counts(db, category_deltas)
+    if before[1] != after[1]:
+        crud_organization.adjust_feed_counts(db, before[1], announcements=-1)
+        crud_organization.adjust_feed_counts(db, after[1], announcements=1)
+
+
 def create_announcement(db: Session, announcement: AnnouncementCreate, author_id: int) -> Announcement:
     """Create new announcement"""
     announcement_data = announcement.model_dump(exclude={"category_ids"})
     db_announcement = Announcement(**announcement_data, author_id=author_id)
+    _apply_content_summary(db_announcement)
+
+    if announcement.status == AnnouncementStatus.PUBLISHED:
+        db_announcement.published_at = datetime.utcnow()
 
     # Add categories
     if announcement.category_ids:
@@ -59,8 +185,12 @@ def create_announcement(db: Session, announcement: AnnouncementCreate, author_id
         db_announcement.categories = categories
 
     db.add(db_announcement)
+    db.flush()
+    _update_feed_counts(db, ([], None), _feed_membership(db_announcement))
+    crud_search.index_announcement(db, db_announcement)
     db.commit()
     db.refresh(db_announcement)
+    invalidate_cache("announcements", "categories", "organizations")
     return db_announcement
 
 
@@ -74,6 +204,7 @@ def update_announcement(
     if not db_announcement:
         return None
 
+    before = _feed_membership(db_announcement)
     update_data = announcement.model_dump(exclude_unset=True, exclude={"category_ids"})
 
     # Handle status change to published
@@ -84,13 +215,19 @@ def update_announcement(
     for field, value in update_data.items():
         setattr(db_announcement, field, value)
 
+    if "content" in update_data:
+        _apply_content_summary(db_announcement)
+
     # Update categories if provided
     if announcement.category_ids is not None:
         categories = db.query(Category).filter(Category.id.in_(announcement.category_ids)).all()
         db_announcement.categories = categories
 
+    _update_feed_counts(db, before, _feed_membership(db_announcement))
+    crud_search.index_announcement(db, db_announcement)
     db.commit()
     db.refresh(db_announcement)
+    invalidate_cache("announcements", "categories", "organizations")
     return db_announcement
 
 
@@ -100,6 +237,9 @@ def delete_announcement(db: Session, announcement_id: int) -> bool:
     if not db_announcement:
         return False
 
+    _update_feed_counts(db, _feed_membership(db_announcement), ([], None))
+    crud_search.remove_announcement(db, announcement_id)
     db.delete(db_announcement)
     db.commit()
+    invalidate_cache("announcements", "categories", "organizations")
     return True
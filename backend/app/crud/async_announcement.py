@@ -0,0 +1,84 @@
+from typing import Optional, List, Tuple
+from datetime import datetime
+from sqlalchemy import select, desc, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.announcement import Announcement, AnnouncementStatus
+from .announcement import _list_load_options, _detail_load_options, _category_filter
+
+
+async def get_announcement(db: AsyncSession, announcement_id: int) -> Optional[Announcement]:
+    """Get announcement by ID"""
+    result = await db.execute(
+        select(Announcement)
+        .options(*_detail_load_options())
+        .where(Announcement.id == announcement_id)
+    )
+    return result.unique().scalars().first()
+
+
+async def get_announcement_by_slug(db: AsyncSession, slug: str) -> Optional[Announcement]:
+    """Get announcement by slug"""
+    result = await db.execute(
+        select(Announcement)
+        .options(*_detail_load_options())
+        .where(Announcement.slug == slug)
+    )
+    return result.unique().scalars().first()
+
+
+async def get_published_announcements(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    category_ids: Optional[List[int]] = None,
+    category_match: str = "any"
+) -> List[Announcement]:
+    """Get published announcements only"""
+    query = (
+        select(Announcement)
+        .options(*_list_load_options())
+        .where(Announcement.status == AnnouncementStatus.PUBLISHED)
+    )
+
+    if category_ids:
+        query = query.where(_category_filter(category_ids, category_match))
+
+    result = await db.execute(
+        query.order_by(desc(Announcement.published_at), desc(Announcement.id))
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.unique().scalars().all())
+
+
+async def get_published_announcements_after(
+    db: AsyncSession,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    limit: int = 20,
+    category_ids: Optional[List[int]] = None,
+    category_match: str = "any"
+) -> List[Announcement]:
+    """Get published announcements after a (published_at, id) keyset position, newest first"""
+    query = (
+        select(Announcement)
+        .options(*_list_load_options())
+        .where(
+            Announcement.status == AnnouncementStatus.PUBLISHED,
+            Announcement.published_at.isnot(None)
+        )
+    )
+
+    if category_ids:
+        query = query.where(_category_filter(category_ids, category_match))
+
+    if cursor:
+        published_at, announcement_id = cursor
+        query = query.where(or_(
+            Announcement.published_at < published_at,
+            and_(Announcement.published_at == published_at, Announcement.id < announcement_id)
+        ))
+
+    result = await db.execute(
+        query.order_by(desc(Announcement.published_at), desc(Announcement.id)).limit(limit)
+    )
+    return list(result.unique().scalars().all())
@@ -0,0 +1,73 @@
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from ..models.event import Event, EventStatus
+from .event import _event_load_options
+
+
+def _list_query():
+    return select(Event).options(
+        joinedload(Event.author),
+        joinedload(Event.organization)
+    )
+
+
+async def get_event_by_slug(db: AsyncSession, slug: str) -> Optional[Event]:
+    """Get event by slug"""
+    result = await db.execute(
+        select(Event).options(*_event_load_options()).where(Event.slug == slug)
+    )
+    return result.unique().scalars().first()
+
+
+async def get_events(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None
+) -> List[Event]:
+    """Get all events with optional status filter"""
+    query = _list_query()
+
+    if status:
+        query = query.where(Event.status == status)
+
+    result = await db.execute(query.order_by(Event.event_date.desc()).offset(skip).limit(limit))
+    return list(result.unique().scalars().all())
+
+
+async def get_published_events(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Event]:
+    """Get published events only"""
+    return await get_events(db, skip=skip, limit=limit, status=EventStatus.PUBLISHED)
+
+
+async def get_published_events_after(
+    db: AsyncSession,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    limit: int = 20
+) -> List[Event]:
+    """Get published events after an (event_date, id) keyset position, latest first"""
+    query = _list_query().where(Event.status == EventStatus.PUBLISHED)
+
+    if cursor:
+        event_date, event_id = cursor
+        query = query.where(or_(
+            Event.event_date < event_date,
+            and_(Event.event_date == event_date, Event.id < event_id)
+        ))
+
+    result = await db.execute(query.order_by(Event.event_date.desc(), Event.id.desc()).limit(limit))
+    return list(result.unique().scalars().all())
+
+
+async def get_upcoming_events(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Event]:
+    """Get upcoming published events"""
+    result = await db.execute(
+        _list_query().where(
+            Event.status == EventStatus.PUBLISHED,
+            Event.event_date > datetime.utcnow()
+        ).order_by(Event.event_date.asc()).offset(skip).limit(limit)
+    )
+    return list(result.unique().scalars().all())
@@ -1,7 +1,10 @@
-from typing import Optional, List
+from typing import Optional, List, Mapping
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from ..models.category import Category
+from ..models.announcement import Announcement, AnnouncementStatus, announcement_categories
 from ..schemas.category import CategoryCreate, CategoryUpdate
+from ..core.cache import invalidate_cache
 
 
 def get_category(db: Session, category_id: int) -> Optional[Category]:
@@ -19,12 +22,50 @@ def get_categories(db: Session, skip: int = 0, limit: int = 100) -> List[Categor
     return db.query(Category).offset(skip).limit(limit).all()
 
 
+def adjust_announcements_counts(db: Session, deltas: Mapping[int, int]) -> None:
+    """Apply per-category deltas to the published announcements counters (caller commits)"""
+    for category_id, delta in deltas.items():
+        if delta:
+            # Counters are derived data: keep updated_at untouched
+            db.query(Category).filter(Category.id == category_id).update(
+                {
+                    Category.announcements_count: Category.announcements_count + delta,
+                    Category.updated_at: Category.updated_at,
+                },
+                synchronize_session=False
+            )
+
+
+def reconcile_announcements_counts(db: Session) -> int:
+    """Repair stored announcements counts that drifted from the announcements table.
+
+    Returns the number of categories that were fixed.
+    """
+    actual_count = select(func.count()).select_from(announcement_categories).join(
+        Announcement, Announcement.id == announcement_categories.c.announcement_id
+    ).where(
+        announcement_categories.c.category_id == Category.id,
+        Announcement.status == AnnouncementStatus.PUBLISHED
+    ).correlate(Category).scalar_subquery()
+
+    fixed = db.query(Category).filter(
+        Category.announcements_count != actual_count
+    ).update(
+        {Category.announcements_count: actual_count, Category.updated_at: Category.updated_at},
+        synchronize_session=False
+    )
+    db.commit()
+    invalidate_cache("categories", "announcements")
+    return fixed
+
+
 def create_category(db: Session, category: CategoryCreate) -> Category:
     """Create new category"""
     db_category = Category(**category.model_dump())
     db.add(db_category)
     db.commit()
     db.refresh(db_category)
+    invalidate_cache("categories", "announcements")  # Announcements embed their categories
     return db_category
 
 
@@ -40,6 +81,7 @@ def update_category(db: Session, category_id: int, category: CategoryUpdate) ->
 
     db.commit()
     db.refresh(db_category)
+    invalidate_cache("categories", "announcements")
     return db_category
 
 
@@ -51,4 +93,5 @@ def delete_category(db: Session, category_id: int) -> bool:
 
     db.delete(db_category)
     db.commit()
+    invalidate_cache("categories", "announcements")
     return True
@@ -1,26 +1,40 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import func, select, and_, or_
+from typing import List, Optional, Tuple
+from datetime import datetime
 from ..models.event import Event, EventStatus
 from ..models.event_registration import EventRegistration
 from ..schemas.event import EventCreate, EventUpdate
+from ..core.cache import invalidate_cache
+from . import search as crud_search
 
 
-def get_event(db: Session, event_id: int) -> Optional[Event]:
+def _event_load_options(with_registrations: bool = False) -> list:
+    """Loader options for single-event fetches.
+
+    The default (detail) profile loads only author and organization; registration
+    rows are loaded only when a call site explicitly asks for them.
+    """
+    options = [
+        joinedload(Event.author),
+        joinedload(Event.organization)
+    ]
+    if with_registrations:
+        options.append(selectinload(Event.registrations))
+    return options
+
+
+def get_event(db: Session, event_id: int, with_registrations: bool = False) -> Optional[Event]:
     """Get event by ID"""
     return db.query(Event).options(
-        joinedload(Event.author),
-        joinedload(Event.organization),
-        joinedload(Event.registrations)
+        *_event_load_options(with_registrations)
     ).filter(Event.id == event_id).first()
 
 
-def get_event_by_slug(db: Session, slug: str) -> Optional[Event]:
+def get_event_by_slug(db: Session, slug: str, with_registrations: bool = False) -> Optional[Event]:
     """Get event by slug"""
     return db.query(Event).options(
-        joinedload(Event.author),
-        joinedload(Event.organization),
-        joinedload(Event.registrations)
+        *_event_load_options(with_registrations)
     ).filter(Event.slug == slug).first()
 
 
@@ -52,6 +66,29 @@ def get_published_events(db: Session, skip: int = 0, limit: int = 100) -> List[E
     ).order_by(Event.event_date.desc()).offset(skip).limit(limit).all()
 
 
+def get_published_events_after(
+    db: Session,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    limit: int = 20
+) -> List[Event]:
+    """Get published events after an (event_date, id) keyset position, latest first"""
+    query = db.query(Event).options(
+        joinedload(Event.author),
+        joinedload(Event.organization)
+    ).filter(
+        Event.status == EventStatus.PUBLISHED
+    )
+
+    if cursor:
+        event_date, event_id = cursor
+        query = query.filter(or_(
+            Event.event_date < event_date,
+            and_(Event.event_date == event_date, Event.id < event_id)
+        ))
+
+    return query.order_by(Event.event_date.desc(), Event.id.desc()).limit(limit).all()
+
+
 def get_upcoming_events(db: Session, skip: int = 0, limit: int = 100) -> List[Event]:
     """Get upcoming published events"""
     from datetime import datetime
@@ -90,8 +127,11 @@ def create_event(db: Session, event: EventCreate, author_id: int) -> Event:
         published_at=datetime.utcnow() if event.status == "published" else None
     )
     db.add(db_event)
+    db.flush()
+    crud_search.index_event(db, db_event)
     db.commit()
     db.refresh(db_event)
+    invalidate_cache("events", "organizations")
     return db_event
 
 
@@ -116,35 +156,72 @@ def update_event(
     for field, value in update_data.items():
         setattr(db_event, field, value)
 
+    crud_search.index_event(db, db_event)
     db.commit()
     db.refresh(db_event)
+    invalidate_cache("events", "organizations")
     return db_event
 
 
 def delete_event(db: Session, event_id: int) -> bool:
     """Delete event"""
-    db_event = get_event(db, event_id)
+    # Registrations are removed through the ORM cascade, so load them in one query
+    db_event = get_event(db, event_id, with_registrations=True)
     if not db_event:
         return False
 
+    crud_search.remove_event(db, event_id)
     db.delete(db_event)
     db.commit()
+    invalidate_cache("events", "organizations")
     return True
 
 
-def get_registrations_count(db: Session, event_id: int) -> int:
-    """Get count of confirmed registrations for an event"""
-    return db.query(func.count(EventRegistration.id)).filter(
-        EventRegistration.event_id == event_id,
-        EventRegistration.status == "confirmed"
-    ).scalar()
+def adjust_registrations_count(db: Session, event_id: int, delta: int) -> None:
+    """Increment or decrement the stored registrations count inside the current transaction"""
+    # The counter is derived data: keep updated_at untouched
+    db.query(Event).filter(Event.id == event_id).update(
+        {Event.registrations_count: Event.registrations_count + delta, Event.updated_at: Event.updated_at},
+        synchronize_session=False
+    )
 
 
-def is_event_full(db: Session, event_id: int) -> bool:
-    """Check if event has reached max participants"""
-    event = get_event(db, event_id)
-    if not event or not event.max_participants:
-        return False
+def reserve_seat(db: Session, event_id: int) -> bool:
+    """Atomically take a seat if the event still has capacity.
+
+    The capacity check and the increment happen in a single conditional UPDATE,
+    so concurrent registrations can never push the count past max_participants.
+    Returns False when the event is full.
+    """
+    reserved = db.query(Event).filter(
+        Event.id == event_id,
+        or_(
+            Event.max_participants.is_(None),
+            Event.registrations_count < Event.max_participants
+        )
+    ).update(
+        {Event.registrations_count: Event.registrations_count + 1, Event.updated_at: Event.updated_at},
+        synchronize_session=False
+    )
+    return reserved == 1
+
 
-    count = get_registrations_count(db, event_id)
-    return count >= event.max_participants
+def reconcile_registrations_counts(db: Session) -> int:
+    """Repair stored registrations counts that drifted from the registrations table.
+
+    Returns the number of events that were fixed.
+    """
+    actual_count = select(func.count(EventRegistration.id)).where(
+        EventRegistration.event_id == Event.id,
+        EventRegistration.status == "confirmed"
+    ).correlate(Event).scalar_subquery()
+
+    fixed = db.query(Event).filter(
+        Event.registrations_count != actual_count
+    ).update(
+        {Event.registrations_count: actual_count, Event.updated_at: Event.updated_at},
+        synchronize_session=False
+    )
+    db.commit()
+    invalidate_cache("events")
+    return fixed
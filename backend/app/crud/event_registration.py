@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from ..models.event_registration import EventRegistration, RegistrationStatus
+from .event import adjust_registrations_count, reserve_seat
 from ..schemas.event_registration import EventRegistrationCreate, EventRegistrationUpdate
+from ..core.cache import invalidate_cache
 
 
 def get_registration(db: Session, registration_id: int) -> Optional[EventRegistration]:
@@ -65,17 +67,41 @@ def create_registration(
     registration: EventRegistrationCreate,
     user_id: Optional[int] = None
 ) -> EventRegistration:
-    """Create new event registration"""
+    """Create new event registration, falling back to the waitlist when the event is full"""
+    if reserve_seat(db, registration.event_id):
+        registration_status = RegistrationStatus.CONFIRMED
+    else:
+        registration_status = RegistrationStatus.WAITLISTED
+
     db_registration = EventRegistration(
         **registration.model_dump(),
-        user_id=user_id
+        user_id=user_id,
+        status=registration_status
     )
     db.add(db_registration)
     db.commit()
     db.refresh(db_registration)
+    invalidate_cache("events")  # Listings show registrations counts
     return db_registration
 
 
+def promote_from_waitlist(db: Session, event_id: int) -> Optional[EventRegistration]:
+    """Confirm the oldest waitlisted registration if a seat is free (within the current transaction)"""
+    next_in_line = db.query(EventRegistration).filter(
+        EventRegistration.event_id == event_id,
+        EventRegistration.status == RegistrationStatus.WAITLISTED
+    ).order_by(
+        EventRegistration.registered_at.asc(),
+        EventRegistration.id.asc()
+    ).with_for_update(skip_locked=True).first()
+
+    if not next_in_line or not reserve_seat(db, event_id):
+        return None
+
+    next_in_line.status = RegistrationStatus.CONFIRMED
+    return next_in_line
+
+
 def update_registration(
     db: Session,
     registration_id: int,
@@ -86,12 +112,21 @@ def update_registration(
     if not db_registration:
         return None
 
+    was_confirmed = db_registration.status == RegistrationStatus.CONFIRMED
+
     update_data = registration_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_registration, field, value)
 
+    is_confirmed = db_registration.status == RegistrationStatus.CONFIRMED
+    if was_confirmed != is_confirmed:
+        adjust_registrations_count(db, db_registration.event_id, 1 if is_confirmed else -1)
+        if was_confirmed:
+            promote_from_waitlist(db, db_registration.event_id)
+
     db.commit()
     db.refresh(db_registration)
+    invalidate_cache("events")
     return db_registration
 
 
@@ -101,6 +136,11 @@ def delete_registration(db: Session, registration_id: int) -> bool:
     if not db_registration:
         return False
 
+    if db_registration.status == RegistrationStatus.CONFIRMED:
+        adjust_registrations_count(db, db_registration.event_id, -1)
+        promote_from_waitlist(db, db_registration.event_id)
+
     db.delete(db_registration)
     db.commit()
+    invalidate_cache("events")
     return True
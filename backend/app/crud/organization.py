@@ -1,7 +1,12 @@
 from typing import Optional, List
+from datetime import datetime
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from ..models.organization import Organization
+from ..models.announcement import Announcement, AnnouncementStatus
+from ..models.event import Event, EventStatus
 from ..schemas.organization import OrganizationCreate, OrganizationUpdate
+from ..core.cache import invalidate_cache
 
 
 def get_organization(db: Session, organization_id: int) -> Optional[Organization]:
@@ -16,7 +21,61 @@ def get_organization_by_slug(db: Session, slug: str) -> Optional[Organization]:
 
 def get_organizations(db: Session, skip: int = 0, limit: int = 100) -> List[Organization]:
     """Get list of organizations"""
-    return db.query(Organization).filter(Organization.is_active == True).offset(skip).limit(limit).all()
+    organizations = db.query(Organization).filter(Organization.is_active == True).offset(skip).limit(limit).all()
+    return with_upcoming_events_counts(db, organizations)
+
+
+def with_upcoming_events_counts(db: Session, organizations: List[Organization]) -> List[Organization]:
+    """Set upcoming_events_count on each organization with one grouped query.
+
+    Counted at read time rather than stored, since events stop being upcoming without any write.
+    """
+    organization_ids = [organization.id for organization in organizations]
+    counts = {}
+    if organization_ids:
+        counts = dict(db.query(Event.organization_id, func.count(Event.id)).filter(
+            Event.organization_id.in_(organization_ids),
+            Event.status == EventStatus.PUBLISHED,
+            Event.event_date > datetime.utcnow()
+        ).group_by(Event.organization_id).all())
+    for organization in organizations:
+        organization.upcoming_events_count = counts.get(organization.id, 0)
+    return organizations
+
+
+def adjust_feed_counts(db: Session, organization_id: Optional[int], announcements: int = 0) -> None:
+    """Apply a delta to an organization's published announcements counter (caller commits)"""
+    if not organization_id or not announcements:
+        return
+    db.query(Organization).filter(Organization.id == organization_id).update(
+        {
+            Organization.announcements_count: Organization.announcements_count + announcements,
+            # Counters are derived data: keep updated_at untouched
+            Organization.updated_at: Organization.updated_at,
+        },
+        synchronize_session=False
+    )
+
+
+def reconcile_feed_counts(db: Session) -> int:
+    """Repair published announcements counters that drifted from the announcements table.
+
+    Returns the number of organizations that were fixed.
+    """
+    announcements = select(func.count(Announcement.id)).where(
+        Announcement.organization_id == Organization.id,
+        Announcement.status == AnnouncementStatus.PUBLISHED
+    ).correlate(Organization).scalar_subquery()
+
+    fixed = db.query(Organization).filter(
+        Organization.announcements_count != announcements
+    ).update(
+        {Organization.announcements_count: announcements, Organization.updated_at: Organization.updated_at},
+        synchronize_session=False
+    )
+    db.commit()
+    invalidate_cache("organizations", "announcements", "events")
+    return fixed
 
 
 def create_organization(db: Session, organization: OrganizationCreate) -> Organization:
@@ -25,6 +84,7 @@ def create_organization(db: Session, organization: OrganizationCreate) -> Organi
     db.add(db_organization)
     db.commit()
     db.refresh(db_organization)
+    invalidate_cache("organizations", "announcements", "events")  # Both embed their organization
     return db_organization
 
 
@@ -40,6 +100,7 @@ def update_organization(db: Session, organization_id: int, organization: Organiz
 
     db.commit()
     db.refresh(db_organization)
+    invalidate_cache("organizations", "announcements", "events")
     return db_organization
 
 
@@ -51,4 +112,5 @@ def delete_organization(db: Session, organization_id: int) -> bool:
 
     db.delete(db_organization)
     db.commit()
+    invalidate_cache("organizations", "announcements", "events")
     return True
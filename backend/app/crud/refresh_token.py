@@ -0,0 +1,98 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from sqlalchemy.orm import Session
+
+from ..models.refresh_token import RefreshToken
+from ..core.config import settings
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_aware(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back as naive UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def get_refresh_token(db: Session, token: str) -> Optional[RefreshToken]:
+    """Get refresh token record by the opaque token (unique index lookup)"""
+    return db.query(RefreshToken).filter(RefreshToken.token_hash == _hash_token(token)).first()
+
+
+def create_refresh_token(db: Session, user_id: int, family_id: Optional[str] = None) -> str:
+    """Issue a new refresh token and return the opaque value given to the client"""
+    token = secrets.token_urlsafe(32)
+    db_token = RefreshToken(
+        user_id=user_id,
+        token_hash=_hash_token(token),
+        family_id=family_id or secrets.token_hex(16),
+        expires_at=_now() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+    db.add(db_token)
+
+    # Expired tokens are useless, drop the user's ones while we are here
+    db.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.expires_at < _now()
+    ).delete(synchronize_session=False)
+
+    db.commit()
+    return token
+
+
+def rotate_refresh_token(db: Session, token: str) -> Optional[Tuple[int, str]]:
+    """Swap a valid refresh token for a new one of the same family; returns (user_id, new token)"""
+    db_token = get_refresh_token(db, token)
+    if not db_token or _as_aware(db_token.expires_at) <= _now():
+        return None
+
+    if db_token.revoked_at is not None:
+        # A rotated token came back: assume it leaked and kill the whole family
+        revoke_refresh_token_family(db, db_token.family_id)
+        return None
+
+    # Conditional update so two concurrent refreshes cannot both rotate the same token
+    revoked = db.query(RefreshToken).filter(
+        RefreshToken.id == db_token.id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: _now()}, synchronize_session=False)
+    if not revoked:
+        db.rollback()
+        return None
+
+    user_id = db_token.user_id
+    return user_id, create_refresh_token(db, user_id, family_id=db_token.family_id)
+
+
+def revoke_refresh_token_family(db: Session, family_id: str) -> None:
+    """Revoke every token issued from the same login"""
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: _now()}, synchronize_session=False)
+    db.commit()
+
+
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    """Revoke the login a refresh token belongs to (logout)"""
+    db_token = get_refresh_token(db, token)
+    if not db_token:
+        return False
+    revoke_refresh_token_family(db, db_token.family_id)
+    return True
+
+
+def revoke_user_refresh_tokens(db: Session, user_id: int) -> None:
+    """Revoke all refresh tokens of a user"""
+    db.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: _now()}, synchronize_session=False)
+    db.commit()
@@ -0,0 +1,319 @@
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import cast, event, func, literal, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session, defer, undefer
+
+from ..models.search_document import SearchDocument
+from ..models.announcement import Announcement, AnnouncementStatus
+from ..models.event import Event, EventStatus
+from ..core.config import settings
+from ..core.text import extract_text, truncate_text
+from ..core.search_engine import InvertedIndex
+
+SEARCH_EXCERPT_LENGTH = 200
+# Relative weight of title, excerpt and body matches
+FTS_COLUMN_WEIGHTS = (10.0, 4.0, 1.0)
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# In-process index used when SEARCH_BACKEND == "memory"
+memory_index = InvertedIndex({"title": 3, "excerpt": 2, "body": 1})
+
+
+def _use_memory() -> bool:
+    return settings.SEARCH_BACKEND == "memory"
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_memory_index_ops(session: Session) -> None:
+    # The in-process index only sees writes that actually committed
+    for key, document in session.info.pop("search_ops", {}).items():
+        if document is None:
+            memory_index.remove(key)
+        else:
+            memory_index.add(key, *document)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_memory_index_ops(session: Session) -> None:
+    session.info.pop("search_ops", None)
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _ts_config():
+    return cast(settings.SEARCH_TS_CONFIG, REGCONFIG)
+
+
+def _remove(db: Session, doc_type: str, doc_id: int) -> None:
+    if _use_memory():
+        db.info.setdefault("search_ops", {})[(doc_type, doc_id)] = None
+        return
+
+    document = db.query(SearchDocument).filter(
+        SearchDocument.doc_type == doc_type,
+        SearchDocument.doc_id == doc_id
+    ).first()
+    if not document:
+        return
+    if _dialect(db) == "sqlite":
+        db.execute(text("DELETE FROM search_documents_fts WHERE rowid = :id"), {"id": document.id})
+    db.delete(document)
+
+
+def _upsert(
+    db: Session,
+    doc_type: str,
+    doc_id: int,
+    slug: str,
+    title: str,
+    excerpt: Optional[str],
+    body: str,
+    published_at
+) -> None:
+    excerpt_text = excerpt or truncate_text(body, SEARCH_EXCERPT_LENGTH)
+    if _use_memory():
+        stored = {
+            "type": doc_type,
+            "id": doc_id,
+            "slug": slug,
+            "title": title,
+            "excerpt": excerpt_text,
+            "published_at": published_at.isoformat() if published_at else None,
+        }
+        fields = {"title": title, "excerpt": excerpt or "", "body": body}
+        db.info.setdefault("search_ops", {})[(doc_type, doc_id)] = (fields, stored)
+        return
+
+    document = db.query(SearchDocument).filter(
+        SearchDocument.doc_type == doc_type,
+        SearchDocument.doc_id == doc_id
+    ).first()
+    if not document:
+        document = SearchDocument(doc_type=doc_type, doc_id=doc_id)
+        db.add(document)
+
+    document.slug = slug
+    document.title = title
+    document.excerpt = excerpt_text
+    document.published_at = published_at
+
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        config = _ts_config()
+        document.search_vector = (
+            func.setweight(func.to_tsvector(config, title), "A")
+            .op("||")(func.setweight(func.to_tsvector(config, excerpt or ""), "B"))
+            .op("||")(func.setweight(func.to_tsvector(config, body), "C"))
+        )
+    db.flush()
+
+    if dialect == "sqlite":
+        db.execute(text("DELETE FROM search_documents_fts WHERE rowid = :id"), {"id": document.id})
+        db.execute(
+            text("INSERT INTO search_documents_fts (rowid, title, excerpt, body) VALUES (:id, :title, :excerpt, :body)"),
+            {"id": document.id, "title": title, "excerpt": excerpt or "", "body": body}
+        )
+
+
+def index_announcement(db: Session, announcement: Announcement) -> None:
+    """Add, refresh or drop the search entry of an announcement (caller commits)"""
+    if announcement.status != AnnouncementStatus.PUBLISHED:
+        _remove(db, "announcement", announcement.id)
+        return
+    _upsert(
+        db, "announcement", announcement.id,
+        slug=announcement.slug,
+        title=announcement.title,
+        excerpt=announcement.excerpt,
+        # Rows written before plain_text existed fall back to parsing content
+        body=announcement.plain_text if announcement.plain_text is not None else extract_text(announcement.content),
+        published_at=announcement.published_at
+    )
+
+
+def index_event(db: Session, event: Event) -> None:
+    """Add, refresh or drop the search entry of an event (caller commits)"""
+    if event.status != EventStatus.PUBLISHED:
+        _remove(db, "event", event.id)
+        return
+    _upsert(
+        db, "event", event.id,
+        slug=event.slug,
+        title=event.title,
+        excerpt=event.excerpt,
+        body=extract_text(event.description),
+        published_at=event.published_at
+    )
+
+
+def remove_announcement(db: Session, announcement_id: int) -> None:
+    """Drop the search entry of a deleted announcement (caller commits)"""
+    _remove(db, "announcement", announcement_id)
+
+
+def remove_event(db: Session, event_id: int) -> None:
+    """Drop the search entry of a deleted event (caller commits)"""
+    _remove(db, "event", event_id)
+
+
+def _fts5_query(q: str) -> str:
+    # Quote every word so user input cannot inject FTS5 syntax; prefix
+    # matching stands in for stemming of inflected (e.g. Russian) word forms
+    return " ".join(f'"{word}"*' for word in WORD_RE.findall(q.lower()))
+
+
+def _hit(document: SearchDocument, score: float) -> Dict[str, Any]:
+    return {
+        "type": document.doc_type,
+        "id": document.doc_id,
+        "slug": document.slug,
+        "title": document.title,
+        "excerpt": document.excerpt,
+        "published_at": document.published_at,
+        "score": score,
+    }
+
+
+def search_documents(
+    db: Session,
+    q: str,
+    doc_type: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Ranked full-text search; returns hits (SearchHit fields) and the total match count"""
+    if _use_memory():
+        where = {"type": doc_type} if doc_type else None
+        results, total = memory_index.search(q, skip=skip, limit=limit, where=where, sort_key="published_at")
+        return [{**stored, "score": score} for stored, score in results], total
+
+    dialect = _dialect(db)
+
+    if dialect == "sqlite":
+        match = _fts5_query(q)
+        if not match:
+            return [], 0
+        type_filter = "AND d.doc_type = :doc_type" if doc_type else ""
+        params = {"match": match, "doc_type": doc_type, "skip": skip, "limit": limit}
+        weights = ", ".join(str(weight) for weight in FTS_COLUMN_WEIGHTS)
+        rows = db.execute(text(
+            f"SELECT d.id, bm25(search_documents_fts, {weights}) AS score "
+            "FROM search_documents_fts JOIN search_documents d ON d.id = search_documents_fts.rowid "
+            f"WHERE search_documents_fts MATCH :match {type_filter} "
+            "ORDER BY score, d.published_at DESC LIMIT :limit OFFSET :skip"
+        ), params).all()
+        total = db.execute(text(
+            "SELECT count(*) FROM search_documents_fts JOIN search_documents d ON d.id = search_documents_fts.rowid "
+            f"WHERE search_documents_fts MATCH :match {type_filter}"
+        ), params).scalar()
+
+        documents = {
+            document.id: document
+            for document in db.query(SearchDocument).filter(SearchDocument.id.in_([row.id for row in rows]))
+        }
+        # bm25() is lower-is-better, flip it so higher scores rank first for clients
+        return [_hit(documents[row.id], -row.score) for row in rows], total
+
+    if dialect == "postgresql":
+        ts_query = func.websearch_to_tsquery(_ts_config(), q)
+        rank = func.ts_rank_cd(SearchDocument.search_vector, ts_query)
+        query = db.query(SearchDocument).options(defer(SearchDocument.search_vector)).filter(
+            SearchDocument.search_vector.op("@@")(ts_query)
+        )
+    else:
+        # No inverted index available, fall back to substring matching
+        rank = literal(1.0)
+        pattern = f"%{q}%"
+        query = db.query(SearchDocument).filter(
+            SearchDocument.title.ilike(pattern) | SearchDocument.excerpt.ilike(pattern)
+        )
+
+    if doc_type:
+        query = query.filter(SearchDocument.doc_type == doc_type)
+
+    total = query.count()
+    rows = (
+        query.add_columns(rank.label("score"))
+        .order_by(rank.desc(), SearchDocument.published_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    return [_hit(document, float(score)) for document, score in rows], total
+
+
+def rebuild_search_index(db: Session, batch_size: int = 500) -> int:
+    """Drop and re-create every search entry from the source tables; returns entries written"""
+    if _use_memory():
+        memory_index.clear()
+    else:
+        if _dialect(db) == "sqlite":
+            db.execute(text("DELETE FROM search_documents_fts"))
+        db.query(SearchDocument).delete(synchronize_session=False)
+        db.flush()
+
+    indexed = 0
+    sources = [
+        (Announcement, Announcement.status == AnnouncementStatus.PUBLISHED, index_announcement, [undefer(Announcement.plain_text)]),
+        (Event, Event.status == EventStatus.PUBLISHED, index_event, []),
+    ]
+    for model, published, index, options in sources:
+        # Walk by primary key in batches so memory stays flat on large tables
+        last_id = 0
+        while True:
+            batch = (
+                db.query(model)
+                .options(*options)
+                .filter(published, model.id > last_id)
+                .order_by(model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            for item in batch:
+                index(db, item)
+            indexed += len(batch)
+            last_id = batch[-1].id
+            db.commit()
+            db.expunge_all()
+
+    return indexed
+
+
+def _source_fingerprint(db: Session) -> List[Tuple]:
+    """Cheap summary of the indexed tables, used to detect a stale snapshot"""
+    fingerprint = []
+    for model, status in ((Announcement, AnnouncementStatus.PUBLISHED), (Event, EventStatus.PUBLISHED)):
+        count, last_change, last_id = db.query(
+            func.count(model.id),
+            func.max(func.coalesce(model.updated_at, model.created_at)),
+            func.max(model.id)
+        ).filter(model.status == status).one()
+        fingerprint.append((count, str(last_change), last_id))
+    return fingerprint
+
+
+def load_search_index(db: Session) -> bool:
+    """Load the in-process index from its snapshot, rebuilding it when missing or stale; returns True if loaded"""
+    path = settings.SEARCH_SNAPSHOT_PATH
+    if os.path.exists(path):
+        try:
+            if memory_index.load(path) == _source_fingerprint(db):
+                return True
+        except (OSError, ValueError, KeyError, EOFError):
+            pass
+
+    rebuild_search_index(db)
+    save_search_index(db)
+    return False
+
+
+def save_search_index(db: Session) -> None:
+    """Write the in-process index snapshot"""
+    memory_index.save(settings.SEARCH_SNAPSHOT_PATH, fingerprint=_source_fingerprint(db))
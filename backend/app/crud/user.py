@@ -1,8 +1,21 @@
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
+from starlette.concurrency import run_in_threadpool
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
-from ..core.security import get_password_hash, verify_password
+from ..core.config import settings
+from ..core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+    PasswordHashingBusy,
+)
+from ..core.cache import user_cache
+from .refresh_token import revoke_user_refresh_tokens
+
+# Columns kept in the authenticated-user cache (the password hash stays in the DB)
+_CACHED_USER_COLUMNS = [column.key for column in User.__table__.columns if column.key != "hashed_password"]
 
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
@@ -10,6 +23,27 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_user_cached(db: Session, user_id: int) -> Optional[User]:
+    """Get user by ID, served from the short-TTL user cache when possible.
+
+    Cache hits are attached to the session without a query, so relationships
+    and the password hash still load lazily if an endpoint needs them.
+    """
+    if not settings.USER_CACHE_ENABLED:
+        return get_user(db, user_id)
+
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        user = get_user(db, user_id)
+        if user:
+            user_cache.set(user_id, {key: getattr(user, key) for key in _CACHED_USER_COLUMNS}, settings.USER_CACHE_TTL)
+        return user
+
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """Get user by email"""
     return db.query(User).filter(User.email == email).first()
@@ -20,11 +54,11 @@ def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
     return db.query(User).offset(skip).limit(limit).all()
 
 
-def create_user(db: Session, user: UserCreate) -> User:
-    """Create new user"""
+def create_user(db: Session, user: UserCreate, hashed_password: Optional[str] = None) -> User:
+    """Create new user (pass hashed_password when the hash was computed elsewhere)"""
     db_user = User(
         email=user.email,
-        hashed_password=get_password_hash(user.password),
+        hashed_password=hashed_password or get_password_hash(user.password),
         full_name=user.full_name,
         role=user.role,
     )
@@ -52,6 +86,11 @@ def update_user(db: Session, user_id: int, user: UserUpdate) -> Optional[User]:
 
     db.commit()
     db.refresh(db_user)
+    user_cache.delete(user_id)
+
+    # A new password or deactivation ends every long-lived session
+    if "hashed_password" in update_data or update_data.get("is_active") is False:
+        revoke_user_refresh_tokens(db, user_id)
     return db_user
 
 
@@ -63,14 +102,37 @@ def delete_user(db: Session, user_id: int) -> bool:
 
     db.delete(db_user)
     db.commit()
+    user_cache.delete(user_id)
     return True
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """Authenticate user by email and password"""
-    user = get_user_by_email(db, email)
+def _store_rehashed_password(db: Session, user_id: int, old_hash: str, hashed_password: str) -> None:
+    # Only replace the hash that was verified; a password changed meanwhile wins
+    db.query(User).filter(User.id == user_id, User.hashed_password == old_hash).update(
+        {User.hashed_password: hashed_password},
+        synchronize_session=False
+    )
+    db.commit()
+
+
+async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[User]:
+    """Authenticate user with the bcrypt check running on the password executor"""
+    user = await run_in_threadpool(get_user_by_email, db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+
+    # Return the pooled connection while waiting for bcrypt; the loaded user stays usable
+    await run_in_threadpool(db.close)
+
+    if not await verify_password_async(password, user.hashed_password):
         return None
+
+    # Migrate the hash to the configured cost; a busy executor just defers it to a later login
+    if password_needs_rehash(user.hashed_password):
+        try:
+            hashed_password = await get_password_hash_async(password)
+        except PasswordHashingBusy:
+            return user
+        await run_in_threadpool(_store_rehashed_password, db, user.id, user.hashed_password, hashed_password)
+        user.hashed_password = hashed_password
     return user
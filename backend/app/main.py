@@ -1,10 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 import os
 
 from .core.config import settings
+from .core.database import engine, async_engine, SessionLocal
+from .core.pool import pool_status
+from .core.security import shutdown_password_executor
+from .core.jobs import shutdown_job_queue
+from .core.cache import ResponseCacheMiddleware
+from .core.conditional import ConditionalGetMiddleware
+from .core.static import UploadStaticFiles
 from .api.api import api_router
+from .crud import search as crud_search
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -12,6 +19,36 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json"
 )
 
+# Cache public read endpoints (added before CORS so CORS headers wrap cached responses)
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        routes=[
+            (rf"{settings.API_V1_STR}/announcements/", "announcements"),
+            (rf"{settings.API_V1_STR}/announcements/feed", "announcements"),
+            (rf"{settings.API_V1_STR}/announcements/slug/[^/]+", "announcements"),
+            (rf"{settings.API_V1_STR}/events/", "events"),
+            (rf"{settings.API_V1_STR}/events/upcoming", "events"),
+            (rf"{settings.API_V1_STR}/events/feed", "events"),
+            (rf"{settings.API_V1_STR}/categories/", "categories"),
+            (rf"{settings.API_V1_STR}/organizations/", "organizations"),
+        ],
+    )
+
+# ETag validation for announcements and events (wraps the cache so hits can return 304).
+# No Last-Modified: the responses embed authors and categories whose changes no single timestamp covers
+app.add_middleware(
+    ConditionalGetMiddleware,
+    routes=[
+        rf"{settings.API_V1_STR}/announcements/",
+        rf"{settings.API_V1_STR}/announcements/feed",
+        rf"{settings.API_V1_STR}/announcements/\d+",
+        rf"{settings.API_V1_STR}/announcements/slug/[^/]+",
+        rf"{settings.API_V1_STR}/events/",
+        rf"{settings.API_V1_STR}/events/[^/]+",
+    ],
+)
+
 # Set up CORS
 app.add_middleware(
     CORSMiddleware,
@@ -23,12 +60,36 @@ app.add_middleware(
 
 # Mount uploads directory for static file serving
 if os.path.exists(settings.UPLOAD_DIR):
-    app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+    app.mount("/uploads", UploadStaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("startup")
+def startup():
+    """Load the in-process search index"""
+    if settings.SEARCH_BACKEND == "memory":
+        db = SessionLocal()
+        try:
+            crud_search.load_search_index(db)
+        finally:
+            db.close()
+
+
+@app.on_event("shutdown")
+def shutdown():
+    """Release background executors and snapshot the in-process search index"""
+    shutdown_password_executor()
+    shutdown_job_queue()
+    if settings.SEARCH_BACKEND == "memory":
+        db = SessionLocal()
+        try:
+            crud_search.save_search_index(db)
+        finally:
+            db.close()
+
+
 @app.get("/")
 def root():
     """Root endpoint"""
@@ -43,3 +104,12 @@ def root():
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/health/db-pool")
+def db_pool_health():
+    """Database connection pool usage and checkout wait metrics"""
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool) if async_engine else None,
+    }
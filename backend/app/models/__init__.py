@@ -5,5 +5,7 @@ from .organization import Organization
 from .employee import Employee
 from .event import Event
 from .event_registration import EventRegistration
+from .refresh_token import RefreshToken
+from .search_document import SearchDocument
 
-__all__ = ["User", "Announcement", "Category", "Organization", "Employee", "Event", "EventRegistration"]
+__all__ = ["User", "Announcement", "Category", "Organization", "Employee", "Event", "EventRegistration", "RefreshToken", "SearchDocument"]
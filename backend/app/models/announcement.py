@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Table
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Table, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import enum
 from ..core.database import Base
 
@@ -16,7 +16,9 @@ announcement_categories = Table(
     'announcement_categories',
     Base.metadata,
     Column('announcement_id', Integer, ForeignKey('announcements.id', ondelete='CASCADE'), primary_key=True),
-    Column('category_id', Integer, ForeignKey('categories.id', ondelete='CASCADE'), primary_key=True)
+    Column('category_id', Integer, ForeignKey('categories.id', ondelete='CASCADE'), primary_key=True),
+    # The primary key serves lookups by announcement; this one serves lookups and counts by category
+    Index('ix_announcement_categories_category_id', 'category_id', 'announcement_id')
 )
 
 
@@ -28,6 +30,11 @@ class Announcement(Base):
     slug = Column(String, unique=True, nullable=False, index=True)
     content = Column(Text, nullable=False)  # JSON content from editor
     excerpt = Column(Text, nullable=True)  # Short description for previews
+    # Derived from content on write (see core.text.summarize_content) so reads never parse the JSON
+    plain_text = deferred(Column(Text, nullable=True))
+    word_count = Column(Integer, nullable=True)
+    reading_time = Column(Integer, nullable=True)  # Minutes
+    auto_excerpt = Column(Text, nullable=True)  # Fallback preview when excerpt is empty
     cover_image = Column(String, nullable=True)  # Path to cover image
     status = Column(Enum(AnnouncementStatus), default=AnnouncementStatus.DRAFT, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -42,3 +49,10 @@ class Announcement(Base):
     organization = relationship("Organization", back_populates="announcements")
     employee = relationship("Employee", foreign_keys=[employee_id])
     categories = relationship("Category", secondary=announcement_categories, back_populates="announcements")
+
+    __table_args__ = (
+        # Admin list: filter by status, newest first
+        Index("ix_announcements_status_created_at", "status", "created_at"),
+        # Public feed: published only, ordered by (published_at, id)
+        Index("ix_announcements_status_published_at", "status", "published_at", "id"),
+    )
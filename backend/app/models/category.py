@@ -11,6 +11,7 @@ class Category(Base):
     name = Column(String, unique=True, nullable=False, index=True)
     slug = Column(String, unique=True, nullable=False, index=True)
     description = Column(String, nullable=True)
+    announcements_count = Column(Integer, default=0, server_default="0", nullable=False)  # Published announcements, maintained by crud
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..core.database import Base
@@ -19,3 +19,8 @@ class Employee(Base):
     # Relationships
     user = relationship("User", back_populates="employments")
     organization = relationship("Organization", back_populates="employees")
+
+    __table_args__ = (
+        # Membership lookups by user and organization
+        Index("ix_employees_user_id_organization_id", "user_id", "organization_id"),
+    )
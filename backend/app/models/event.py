@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -25,6 +25,7 @@ class Event(Base):
     event_date = Column(DateTime(timezone=True), nullable=False)  # When the event happens
     registration_deadline = Column(DateTime(timezone=True), nullable=True)  # Last date to register
     max_participants = Column(Integer, nullable=True)  # Null = unlimited
+    registrations_count = Column(Integer, default=0, server_default="0", nullable=False)  # Confirmed registrations, maintained by crud
     status = Column(Enum(EventStatus), default=EventStatus.DRAFT, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=True)
@@ -36,3 +37,8 @@ class Event(Base):
     author = relationship("User", back_populates="events")
     organization = relationship("Organization", back_populates="events")
     registrations = relationship("EventRegistration", back_populates="event", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Event listings: filter by status, order by (event_date, id)
+        Index("ix_events_status_event_date", "status", "event_date", "id"),
+    )
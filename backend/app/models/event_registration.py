@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -8,6 +8,7 @@ from ..core.database import Base
 class RegistrationStatus(str, enum.Enum):
     PENDING = "pending"
     CONFIRMED = "confirmed"
+    WAITLISTED = "waitlisted"  # Event was full at registration time
     CANCELLED = "cancelled"
 
 
@@ -30,3 +31,8 @@ class EventRegistration(Base):
     # Relationships
     event = relationship("Event", back_populates="registrations")
     user = relationship("User", back_populates="event_registrations")
+
+    __table_args__ = (
+        # Registration counts and waitlist lookups per event
+        Index("ix_event_registrations_event_id_status", "event_id", "status"),
+    )
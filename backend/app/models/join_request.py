@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -27,3 +27,8 @@ class JoinRequest(Base):
     # Relationships
     user = relationship("User", back_populates="join_requests")
     organization = relationship("Organization", back_populates="join_requests")
+
+    __table_args__ = (
+        # Pending requests per organization
+        Index("ix_join_requests_organization_id_status", "organization_id", "status"),
+    )
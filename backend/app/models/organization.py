@@ -15,6 +15,8 @@ class Organization(Base):
     website = Column(String, nullable=True)
     email = Column(String, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
+    # Feed counter, maintained by crud (upcoming events are counted at read time)
+    announcements_count = Column(Integer, default=0, server_default="0", nullable=False)  # Published announcements
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
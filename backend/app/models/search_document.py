@@ -0,0 +1,47 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, DDL, UniqueConstraint, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from ..core.database import Base
+
+
+class SearchDocument(Base):
+    """Search index entry of a published announcement or event (maintained by crud)"""
+    __tablename__ = "search_documents"
+
+    id = Column(Integer, primary_key=True, index=True)
+    doc_type = Column(String(20), nullable=False)  # "announcement" or "event"
+    doc_id = Column(Integer, nullable=False)
+    slug = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    excerpt = Column(Text, nullable=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    # Weighted title/excerpt/body vector on PostgreSQL; SQLite keeps the text in search_documents_fts
+    search_vector = Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("doc_type", "doc_id", name="uq_search_documents_doc"),
+    )
+
+
+# Dialect-specific inverted indexes
+event.listen(
+    SearchDocument.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_search_documents_search_vector "
+        "ON search_documents USING gin (search_vector)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    SearchDocument.__table__,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts "
+        "USING fts5(title, excerpt, body, tokenize = 'unicode61 remove_diacritics 2')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    SearchDocument.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS search_documents_fts").execute_if(dialect="sqlite"),
+)
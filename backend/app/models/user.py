@@ -29,3 +29,4 @@ class User(Base):
     join_requests = relationship("JoinRequest", back_populates="user")
     events = relationship("Event", back_populates="author")
     event_registrations = relationship("EventRegistration", back_populates="user")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
@@ -1,7 +1,7 @@
 from .user import User, UserCreate, UserUpdate, Token, LoginRequest
 from .category import Category, CategoryCreate, CategoryUpdate
-from .announcement import Announcement, AnnouncementCreate, AnnouncementUpdate, AnnouncementList
-from .event import EventCreate, EventUpdate, EventOut, EventList
+from .announcement import Announcement, AnnouncementCreate, AnnouncementUpdate, AnnouncementList, AnnouncementPage
+from .event import EventCreate, EventUpdate, EventOut, EventList, EventPage
 from .event_registration import EventRegistrationCreate, EventRegistrationUpdate, EventRegistrationOut
 
 __all__ = [
@@ -17,10 +17,12 @@ __all__ = [
     "AnnouncementCreate",
     "AnnouncementUpdate",
     "AnnouncementList",
+    "AnnouncementPage",
     "EventCreate",
     "EventUpdate",
     "EventOut",
     "EventList",
+    "EventPage",
     "EventRegistrationCreate",
     "EventRegistrationUpdate",
     "EventRegistrationOut",
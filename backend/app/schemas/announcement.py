@@ -40,6 +40,9 @@ class AnnouncementUpdate(BaseModel):
 class AnnouncementInDB(AnnouncementBase):
     id: int
     author_id: int
+    auto_excerpt: Optional[str] = None
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None  # Minutes
     published_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -61,6 +64,9 @@ class AnnouncementList(BaseModel):
     title: str
     slug: str
     excerpt: Optional[str] = None
+    auto_excerpt: Optional[str] = None
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None  # Minutes
     cover_image: Optional[str] = None
     status: AnnouncementStatus
     author: User
@@ -74,6 +80,12 @@ class AnnouncementList(BaseModel):
         from_attributes = True
 
 
+class AnnouncementPage(BaseModel):
+    """Keyset-paginated page of announcements"""
+    items: List[AnnouncementList]
+    next_cursor: Optional[str] = None
+
+
 # Import after class definitions to avoid circular imports
 from .organization import Organization
 from .employee import Employee
@@ -21,6 +21,7 @@ class CategoryUpdate(BaseModel):
 
 class CategoryInDB(CategoryBase):
     id: int
+    announcements_count: int = 0
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -67,3 +67,9 @@ class EventList(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class EventPage(BaseModel):
+    """Keyset-paginated page of events"""
+    items: List[EventList]
+    next_cursor: Optional[str] = None
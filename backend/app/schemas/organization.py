@@ -29,6 +29,7 @@ class OrganizationUpdate(BaseModel):
 
 class OrganizationInDB(OrganizationBase):
     id: int
+    announcements_count: int = 0
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -37,4 +38,8 @@ class OrganizationInDB(OrganizationBase):
 
 
 class Organization(OrganizationInDB):
+    upcoming_events_count: int = 0  # Set by crud.organization.with_upcoming_events_counts
+
+
+class OrganizationOut(OrganizationInDB):
     pass
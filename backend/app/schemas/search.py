@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+
+class SearchHit(BaseModel):
+    type: str  # "announcement" or "event"
+    id: int
+    slug: str
+    title: str
+    excerpt: Optional[str] = None
+    published_at: Optional[datetime] = None
+    score: float
+
+
+class SearchResults(BaseModel):
+    """Ranked page of search hits"""
+    items: List[SearchHit]
+    total: int
@@ -39,10 +39,19 @@ class User(UserInDB):
     pass
 
 
+class UserOut(UserInDB):
+    pass
+
+
 # Auth schemas
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 
 class TokenPayload(BaseModel):
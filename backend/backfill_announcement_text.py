@@ -0,0 +1,59 @@
+"""
+Backfill derived announcement text fields
+Fills plain_text, word_count, reading_time and auto_excerpt from content for
+announcements written before these columns existed (or all with --all)
+"""
+import argparse
+
+from app.core.database import SessionLocal
+from app.core.text import summarize_content
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement
+from app.models.category import Category
+from app.models.event import Event
+from app.models.event_registration import EventRegistration
+
+
+def backfill_announcement_text(recompute_all: bool = False, batch_size: int = 500):
+    """Derive text fields from content in primary key batches"""
+    db = SessionLocal()
+    updated = 0
+    try:
+        last_id = 0
+        while True:
+            query = db.query(Announcement.id, Announcement.content).filter(Announcement.id > last_id)
+            if not recompute_all:
+                query = query.filter(Announcement.plain_text.is_(None))
+            batch = query.order_by(Announcement.id).limit(batch_size).all()
+            if not batch:
+                break
+
+            # Bulk UPDATE by primary key, without loading full ORM objects
+            db.bulk_update_mappings(Announcement, [
+                {"id": announcement_id, **summarize_content(content)}
+                for announcement_id, content in batch
+            ])
+            db.commit()
+            updated += len(batch)
+            last_id = batch[-1].id
+
+        print(f"[+] Updated announcements: {updated}")
+    except Exception as e:
+        print(f"[!] Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--all", action="store_true", help="recompute every announcement, not only missing ones")
+    args = parser.parse_args()
+
+    print("Backfilling announcement text fields...")
+    backfill_announcement_text(recompute_all=args.all)
+    print("[+] Backfill complete!")
@@ -0,0 +1,73 @@
+"""
+Benchmark API latency during a burst of logins
+Samples GET /announcements/ on a running server while idle and while N
+concurrent POST /auth/login requests are in flight, to show whether bcrypt
+work starves the event loop (needs an existing user's credentials)
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _request(url: str, data: bytes = None) -> int:
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def _sample(url: str, count: int, stop: threading.Event = None):
+    timings = []
+    while len(timings) < count and not (stop and stop.is_set()):
+        started = time.perf_counter()
+        _request(f"{url}/announcements/")
+        timings.append((time.perf_counter() - started) * 1000)
+        time.sleep(0.02)
+    return timings
+
+
+def _summary(timings) -> str:
+    timings = sorted(timings)
+    return (
+        f"p50 {statistics.median(timings):.1f}ms, p95 {timings[int(len(timings) * 0.95) - 1]:.1f}ms, "
+        f"max {timings[-1]:.1f}ms ({len(timings)} requests)"
+    )
+
+
+def benchmark_login(url: str, email: str, password: str, logins: int):
+    """Compare read latency idle and during a login burst"""
+    print(f"[+] Idle: {_summary(_sample(url, 20))}")
+
+    body = json.dumps({"email": email, "password": password}).encode()
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=logins + 1) as executor:
+        sampler = executor.submit(_sample, url, 1000, stop)
+        started = time.perf_counter()
+        codes = list(executor.map(lambda _: _request(f"{url}/auth/login", body), range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        timings = sampler.result()
+
+    print(f"[+] During {logins} logins: {_summary(timings)}")
+    print(f"[+] Logins finished in {elapsed:.1f}s, status codes: {dict(Counter(codes))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/v1", help="API base URL")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=20, help="concurrent login requests")
+    args = parser.parse_args()
+
+    print("Benchmarking login burst...")
+    benchmark_login(args.url.rstrip("/"), args.email, args.password, args.logins)
@@ -0,0 +1,104 @@
+"""
+Benchmark the in-process search index
+Builds an index of synthetic Russian/English documents and measures build
+time, query latency and snapshot save/load time (no database needed)
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from itertools import accumulate
+
+from app.core.search_engine import InvertedIndex
+
+RU_SYLLABLES = "ба ве ги до жу за ки ло ме ну по ри са ту фе хи це чу ша ще ю я ст пр кр но ра та ла ре ко".split()
+EN_SYLLABLES = "ba be co de fi ga he in jo ka le mi no pa qu re si ta un ve wo xe yo ze st pr tr".split()
+RU_ENDINGS = ["", "а", "ы", "ов", "ами", "ение", "ость", "ный", "ная", "ить", "ует"]
+EN_ENDINGS = ["", "s", "ing", "ed", "tion", "ness", "ly"]
+# Zipf-distributed vocabulary: a few very common words, a long tail of rare ones
+VOCABULARY_SIZE = 50_000
+
+
+def _vocabulary(rng: random.Random):
+    words = []
+    for _ in range(VOCABULARY_SIZE):
+        russian = rng.random() < 0.8
+        syllables, endings = (RU_SYLLABLES, RU_ENDINGS) if russian else (EN_SYLLABLES, EN_ENDINGS)
+        words.append("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) + rng.choice(endings))
+    weights = list(accumulate(1 / rank for rank in range(1, VOCABULARY_SIZE + 1)))
+    return words, weights
+
+
+def _words(rng: random.Random, vocabulary, count: int) -> str:
+    words, weights = vocabulary
+    return " ".join(rng.choices(words, cum_weights=weights, k=count))
+
+
+def benchmark_search(documents: int, runs: int):
+    """Build, query and snapshot a synthetic index"""
+    rng = random.Random(42)
+    vocabulary = _vocabulary(rng)
+    corpus = [
+        (
+            {
+                "title": _words(rng, vocabulary, 6),
+                "excerpt": _words(rng, vocabulary, 20),
+                "body": _words(rng, vocabulary, 150),
+            },
+            {"type": "announcement", "id": i, "published_at": f"2026-01-01T00:00:{i % 60:02d}"},
+        )
+        for i in range(documents)
+    ]
+    # Single terms by vocabulary rank (frequent to rare) and two-term AND queries
+    words = vocabulary[0]
+    queries = {
+        "top-10 term": [words[i] for i in range(10)],
+        "rank 100-1000 term": [words[i] for i in range(100, 1000, 90)],
+        "rank 10k+ term": [words[i] for i in range(10_000, 50_000, 4000)],
+        "two terms": [f"{words[i]} {words[i * 7 + 50]}" for i in range(1, 11)],
+    }
+    index = InvertedIndex({"title": 3, "excerpt": 2, "body": 1})
+
+    started = time.perf_counter()
+    for fields, stored in corpus:
+        index.add(("announcement", stored["id"]), fields, stored)
+    print(f"[+] Build: {documents} documents in {time.perf_counter() - started:.1f}s")
+
+    for name, group in queries.items():
+        timings, hits = [], 0
+        for query in group:
+            for _ in range(runs):
+                started = time.perf_counter()
+                _, total = index.search(query, limit=20)
+                timings.append(time.perf_counter() - started)
+            hits += total
+        timings.sort()
+        print(
+            f"[+] {name}: ~{hits // len(group)} hits, p50 {timings[len(timings) // 2] * 1000:.2f}ms, "
+            f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f}ms"
+        )
+
+    started = time.perf_counter()
+    for fields, stored in corpus[:1000]:
+        index.add(("announcement", stored["id"]), fields, stored)
+    print(f"[+] Re-index 1000 documents: {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "search_index.snapshot")
+        started = time.perf_counter()
+        index.save(path)
+        print(f"[+] Snapshot save: {time.perf_counter() - started:.2f}s, {os.path.getsize(path) / 1e6:.1f} MB")
+        started = time.perf_counter()
+        InvertedIndex(index.field_weights).load(path)
+        print(f"[+] Snapshot load: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5, help="runs per query")
+    args = parser.parse_args()
+
+    print("Benchmarking search index...")
+    benchmark_search(args.documents, args.runs)
@@ -0,0 +1,132 @@
+"""
+Check the number of SQL queries behind announcement responses
+Seeds a scratch SQLite database, runs the announcement read paths and
+serializes their results with the response schemas, failing if the query
+count grows with the number of rows (N+1 lazy loads)
+"""
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.crud import announcement as crud_announcement
+from app.schemas.announcement import Announcement as AnnouncementSchema, AnnouncementList
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement, AnnouncementStatus
+from app.models.category import Category
+from app.models.event import Event
+from app.models.event_registration import EventRegistration
+
+# Read path -> maximum statements, independent of the number of rows
+QUERY_BUDGETS = {
+    "get_published_announcements": 2,  # rows + author (joined), categories (selectin)
+    "get_published_announcements_after": 2,
+    "get_announcements": 2,
+    "get_announcement": 2,  # row + author/organization/employee (joined), categories (selectin)
+    "get_announcement_by_slug": 2,
+}
+
+
+def _seed(db, announcements: int) -> None:
+    authors = [User(email=f"author{i}@example.com", hashed_password="-") for i in range(5)]
+    organization = Organization(name="Org", slug="org")
+    categories = [Category(name=f"Category {i}", slug=f"category-{i}") for i in range(4)]
+    db.add_all(authors + categories + [organization])
+    db.flush()
+    employee = Employee(user_id=authors[0].id, organization_id=organization.id, position="Editor")
+    db.add(employee)
+    db.flush()
+
+    now = datetime.utcnow()
+    for i in range(announcements):
+        db.add(Announcement(
+            title=f"Announcement {i}",
+            slug=f"announcement-{i}",
+            content="{}",
+            status=AnnouncementStatus.PUBLISHED,
+            author_id=authors[i % len(authors)].id,
+            organization_id=organization.id,
+            employee_id=employee.id,
+            published_at=now - timedelta(minutes=i),
+            categories=[categories[i % 4], categories[(i + 1) % 4]]
+        ))
+    db.commit()
+
+
+def check_query_counts(database_url: str, announcements: int) -> bool:
+    """Count statements per read path including serialization; returns True if all are within budget"""
+    engine = create_engine(database_url)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    read_paths = {
+        "get_published_announcements": (
+            lambda db: crud_announcement.get_published_announcements(db, limit=announcements), AnnouncementList
+        ),
+        "get_published_announcements_after": (
+            lambda db: crud_announcement.get_published_announcements_after(db, limit=announcements), AnnouncementList
+        ),
+        "get_announcements": (
+            lambda db: crud_announcement.get_announcements(db, limit=announcements), AnnouncementList
+        ),
+        "get_announcement": (
+            lambda db: [crud_announcement.get_announcement(db, 1)], AnnouncementSchema
+        ),
+        "get_announcement_by_slug": (
+            lambda db: [crud_announcement.get_announcement_by_slug(db, "announcement-0")], AnnouncementSchema
+        ),
+    }
+
+    ok = True
+    try:
+        db = Session()
+        _seed(db, announcements)
+        db.close()
+
+        for name, (read, schema) in read_paths.items():
+            db = Session()
+            statements.clear()
+            rows = read(db)
+            # Serializing touches every relationship the response schema exposes
+            for row in rows:
+                schema.model_validate(row).model_dump()
+            count = len(statements)
+            db.close()
+
+            budget = QUERY_BUDGETS[name]
+            marker = "+" if count <= budget else "!"
+            print(f"[{marker}] {name}: {len(rows)} rows, {count} queries (budget {budget})")
+            ok = ok and count <= budget
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", help="scratch database (default: temporary SQLite file)")
+    parser.add_argument("--announcements", type=int, default=50)
+    args = parser.parse_args()
+
+    print("Checking announcement query counts...")
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.database_url or f"sqlite:///{os.path.join(directory, 'query_counts.db')}"
+        ok = check_query_counts(url, args.announcements)
+
+    if not ok:
+        print("[!] Query count check failed")
+        sys.exit(1)
+    print("[+] Query counts within budget")
@@ -0,0 +1,156 @@
+"""
+Check that the hot feed and lookup queries use their composite indexes
+Runs the real crud read paths against a scratch database, captures the SQL
+they issue and EXPLAINs it, failing if the expected index is not in the plan.
+Uses a temporary SQLite file by default; pass --database-url to check an
+empty PostgreSQL database instead (sequential scans are disabled there so the
+planner's choice does not depend on table size)
+"""
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.crud import announcement as crud_announcement
+from app.crud import event as crud_event
+from app.crud import event_registration as crud_registration
+from app.crud import employee as crud_employee
+from app.crud import join_request as crud_join_request
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement, AnnouncementStatus
+from app.models.category import Category
+from app.models.event import Event, EventStatus
+from app.models.event_registration import EventRegistration
+
+# Read path -> (call, indexes of which one must appear in the plan of its first query)
+READ_PATHS = {
+    "published announcements feed": (
+        lambda db: crud_announcement.get_published_announcements_after(db), {"ix_announcements_status_published_at"}
+    ),
+    "published announcements list": (
+        lambda db: crud_announcement.get_published_announcements(db), {"ix_announcements_status_published_at"}
+    ),
+    "announcements by status": (
+        lambda db: crud_announcement.get_announcements(db, status=AnnouncementStatus.DRAFT),
+        {"ix_announcements_status_created_at"}
+    ),
+    "published events feed": (
+        lambda db: crud_event.get_published_events_after(db), {"ix_events_status_event_date"}
+    ),
+    "upcoming events": (
+        lambda db: crud_event.get_upcoming_events(db), {"ix_events_status_event_date"}
+    ),
+    "waitlist head": (
+        lambda db: crud_registration.promote_from_waitlist(db, 1), {"ix_event_registrations_event_id_status"}
+    ),
+    "employee by user and organization": (
+        lambda db: crud_employee.get_employee_by_user_and_org(db, 1, 1), {"ix_employees_user_id_organization_id"}
+    ),
+    "pending join requests": (
+        lambda db: crud_join_request.get_pending_join_requests_by_organization(db, 1),
+        {"ix_join_requests_organization_id_status"}
+    ),
+}
+
+
+def _seed(db) -> None:
+    user = User(email="plans@example.com", hashed_password="-")
+    organization = Organization(name="Org", slug="org")
+    db.add_all([user, organization])
+    db.flush()
+    now = datetime.utcnow()
+    for i in range(200):
+        status = AnnouncementStatus.PUBLISHED if i % 4 else AnnouncementStatus.DRAFT
+        db.add(Announcement(
+            title=f"A{i}", slug=f"a{i}", content="{}", status=status, author_id=user.id,
+            published_at=now - timedelta(hours=i) if status == AnnouncementStatus.PUBLISHED else None
+        ))
+        db.add(Event(
+            title=f"E{i}", slug=f"e{i}", description="", event_date=now + timedelta(days=i - 100),
+            status=EventStatus.PUBLISHED if i % 4 else EventStatus.DRAFT, author_id=user.id
+        ))
+    # Enough employees that ANALYZE statistics do not favour a full scan
+    members = [User(email=f"member{i}@example.com", hashed_password="-") for i in range(50)]
+    db.add_all(members)
+    db.flush()
+    db.add_all(Employee(user_id=member.id, organization_id=organization.id, position="Member") for member in members)
+    db.commit()
+
+
+def _explain(connection, dialect: str, statement: str, parameters) -> str:
+    if dialect == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return "\n".join(row[-1] for row in rows)
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def check_query_plans(database_url: str, verbose: bool = False) -> bool:
+    """EXPLAIN the first query of every read path; returns True if each uses an expected index"""
+    engine = create_engine(database_url)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    dialect = engine.dialect.name
+
+    captured = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, parameters, *args: captured.append((statement, parameters)))
+
+    ok = True
+    try:
+        db = Session()
+        _seed(db)
+        db.close()
+        with engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+
+        for name, (read, indexes) in READ_PATHS.items():
+            db = Session()
+            captured.clear()
+            read(db)
+            db.rollback()
+            db.close()
+            statement, parameters = next((s, p) for s, p in captured if s.lstrip().upper().startswith("SELECT"))
+
+            with engine.connect() as connection:
+                if dialect == "postgresql":
+                    connection.exec_driver_sql("SET enable_seqscan = off")
+                plan = _explain(connection, dialect, statement, parameters)
+
+            used = sorted(index for index in indexes if index in plan)
+            if used:
+                print(f"[+] {name}: uses {', '.join(used)}")
+            else:
+                print(f"[!] {name}: none of {', '.join(sorted(indexes))} in plan")
+                ok = False
+            if verbose or not used:
+                print("    " + plan.replace("\n", "\n    "))
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", help="scratch database (default: temporary SQLite file)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    print("Checking query plans...")
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.database_url or f"sqlite:///{os.path.join(directory, 'query_plans.db')}"
+        ok = check_query_plans(url, verbose=args.verbose)
+
+    if not ok:
+        print("[!] Query plan check failed")
+        sys.exit(1)
+    print("[+] All checked queries use their indexes")
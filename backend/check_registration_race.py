@@ -0,0 +1,131 @@
+"""
+Check event registrations for overbooking under concurrency
+Fires N parallel registrations at one limited-capacity event in a scratch
+database and verifies that confirmed seats never exceed max_participants.
+Uses a temporary SQLite file by default; pass --database-url to run against
+an empty PostgreSQL database instead (tables are created and dropped)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.crud import event_registration as crud_registration
+from app.schemas.event_registration import EventRegistrationCreate
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement
+from app.models.category import Category
+from app.models.event import Event, EventStatus
+from app.models.event_registration import EventRegistration, RegistrationStatus
+
+
+def check_registration_race(database_url: str, registrations: int, capacity: int) -> bool:
+    """Register concurrently and compare confirmed seats with capacity; returns True if consistent"""
+    connect_args = {"timeout": 60, "check_same_thread": False} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args, pool_size=registrations, max_overflow=0)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    try:
+        db = Session()
+        author = User(email="race-check@example.com", hashed_password="-")
+        db.add(author)
+        db.flush()
+        event = Event(
+            title="Race check",
+            slug="race-check",
+            description="",
+            event_date=datetime.utcnow() + timedelta(days=7),
+            max_participants=capacity,
+            status=EventStatus.PUBLISHED,
+            author_id=author.id
+        )
+        db.add(event)
+        db.commit()
+        event_id = event.id
+        db.close()
+
+        # Release every worker at once to maximise contention
+        barrier = threading.Barrier(registrations)
+        errors = []
+
+        def register(i: int):
+            session = Session()
+            try:
+                barrier.wait()
+                crud_registration.create_registration(session, EventRegistrationCreate(
+                    event_id=event_id,
+                    guest_name=f"Guest {i}",
+                    guest_email=f"guest{i}@example.com"
+                ))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(max_workers=registrations) as executor:
+            list(executor.map(register, range(registrations)))
+
+        db = Session()
+        statuses = dict(
+            db.query(EventRegistration.status, func.count(EventRegistration.id))
+            .filter(EventRegistration.event_id == event_id)
+            .group_by(EventRegistration.status)
+            .all()
+        )
+        stored_count = db.query(Event.registrations_count).filter(Event.id == event_id).scalar()
+        db.close()
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+    confirmed = statuses.get(RegistrationStatus.CONFIRMED, 0)
+    waitlisted = statuses.get(RegistrationStatus.WAITLISTED, 0)
+    print(f"[+] Registrations: {registrations}, capacity: {capacity}, errors: {len(errors)}")
+    print(f"[+] Confirmed: {confirmed}, waitlisted: {waitlisted}, stored count: {stored_count}")
+    for error in errors[:5]:
+        print(f"[!] Error: {error!r}")
+
+    ok = True
+    if confirmed > capacity:
+        print(f"[!] Overbooked by {confirmed - capacity}")
+        ok = False
+    if stored_count != confirmed:
+        print("[!] registrations_count does not match confirmed registrations")
+        ok = False
+    if confirmed + waitlisted + len(errors) != registrations:
+        print("[!] Some registrations were neither confirmed nor waitlisted")
+        ok = False
+    if not errors and confirmed < min(capacity, registrations):
+        print("[!] Seats left free although registrations were waitlisted")
+        ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", help="scratch database (default: temporary SQLite file)")
+    parser.add_argument("-n", "--registrations", type=int, default=50)
+    parser.add_argument("--capacity", type=int, default=10)
+    args = parser.parse_args()
+
+    print("Checking concurrent registrations...")
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.database_url or f"sqlite:///{os.path.join(directory, 'race_check.db')}"
+        ok = check_registration_race(url, args.registrations, args.capacity)
+
+    if not ok:
+        print("[!] Overbooking check failed")
+        sys.exit(1)
+    print("[+] No overbooking")
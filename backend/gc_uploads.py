@@ -0,0 +1,92 @@
+"""
+Garbage-collect uploaded images
+Deletes stored images (original, variants and manifest) that are no longer
+referenced by Announcement.cover_image/content, Event.cover_image/description
+or Organization.logo
+"""
+import argparse
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.images import find_upload_ids, upload_id_from_name
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement
+from app.models.event import Event
+from app.models.event_registration import EventRegistration
+
+# Columns that may hold upload URLs
+REFERENCE_COLUMNS = [
+    Announcement.cover_image,
+    Announcement.content,
+    Event.cover_image,
+    Event.description,
+    Organization.logo,
+]
+
+
+def collect_referenced_ids(db) -> set:
+    """Ids of every upload referenced from the database"""
+    referenced = set()
+    for column in REFERENCE_COLUMNS:
+        rows = db.query(column).filter(column.like("%/uploads/images/%")).yield_per(500)
+        for (value,) in rows:
+            referenced |= find_upload_ids(value)
+    return referenced
+
+
+def gc_uploads(grace_hours: float, dry_run: bool):
+    """Delete upload files whose id is not referenced and that are older than the grace period"""
+    images_dir = Path(settings.UPLOAD_DIR) / "images"
+
+    # Files of an upload are grouped by id, so variants go together with their original
+    groups = defaultdict(list)
+    for path in images_dir.iterdir():
+        upload_id = upload_id_from_name(path.name)
+        if path.is_file() and upload_id:
+            groups[upload_id].append(path)
+
+    db = SessionLocal()
+    try:
+        referenced = collect_referenced_ids(db)
+    except Exception as e:
+        print(f"[!] Error: {e}")
+        return
+    finally:
+        db.close()
+
+    # Fresh uploads may not be saved on an announcement yet
+    cutoff = time.time() - grace_hours * 3600
+    removed_files = 0
+    removed_bytes = 0
+    for upload_id, paths in groups.items():
+        if upload_id in referenced:
+            continue
+        if max(path.stat().st_mtime for path in paths) > cutoff:
+            continue
+        for path in paths:
+            removed_bytes += path.stat().st_size
+            removed_files += 1
+            if not dry_run:
+                path.unlink(missing_ok=True)
+
+    action = "Would remove" if dry_run else "Removed"
+    print(f"[+] Referenced uploads: {len(referenced)}")
+    print(f"[+] {action} {removed_files} files ({removed_bytes / 1048576:.1f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete unreferenced uploaded images")
+    parser.add_argument("--grace-hours", type=float, default=24, help="keep unreferenced files younger than this")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be deleted")
+    args = parser.parse_args()
+
+    print("Collecting unreferenced uploads...")
+    gc_uploads(args.grace_hours, args.dry_run)
+    print("[+] Upload garbage collection complete!")
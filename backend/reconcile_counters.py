@@ -0,0 +1,40 @@
+"""
+Reconcile denormalized counters
+Repairs Event.registrations_count values that drifted from event_registrations
+and the category/organization published announcements counters
+"""
+from app.core.database import SessionLocal
+from app.crud import event as crud_event
+from app.crud import category as crud_category
+from app.crud import organization as crud_organization
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement
+from app.models.event import Event
+from app.models.event_registration import EventRegistration
+
+
+def reconcile_counters():
+    """Recompute drifted counters from their source tables"""
+    db = SessionLocal()
+    try:
+        fixed = crud_event.reconcile_registrations_counts(db)
+        print(f"[+] Events with repaired registrations count: {fixed}")
+        fixed = crud_category.reconcile_announcements_counts(db)
+        print(f"[+] Categories with repaired announcements count: {fixed}")
+        fixed = crud_organization.reconcile_feed_counts(db)
+        print(f"[+] Organizations with repaired feed counts: {fixed}")
+    except Exception as e:
+        print(f"[!] Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print("Reconciling counters...")
+    reconcile_counters()
+    print("[+] Reconciliation complete!")
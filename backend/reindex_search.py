@@ -0,0 +1,39 @@
+"""
+Rebuild the full-text search index
+Re-creates search entries for all published announcements and events
+"""
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.crud import search as crud_search
+# Import all models to ensure relationships are properly set up
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.employee import Employee
+from app.models.join_request import JoinRequest
+from app.models.announcement import Announcement
+from app.models.category import Category
+from app.models.event import Event
+from app.models.event_registration import EventRegistration
+
+
+def reindex_search():
+    """Rebuild search entries from the announcements and events tables"""
+    db = SessionLocal()
+    try:
+        indexed = crud_search.rebuild_search_index(db)
+        print(f"[+] Indexed documents: {indexed}")
+        if settings.SEARCH_BACKEND == "memory":
+            # The running API picks the snapshot up on its next start
+            crud_search.save_search_index(db)
+            print(f"[+] Snapshot written: {settings.SEARCH_SNAPSHOT_PATH}")
+    except Exception as e:
+        print(f"[!] Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print("Rebuilding search index...")
+    reindex_search()
+    print("[+] Search index rebuilt!")
@@ -11,6 +11,8 @@ from app.models.employee import Employee
 from app.models.category import Category
 from app.models.announcement import Announcement, AnnouncementStatus
 from app.core.database import Base
+from app.crud import category as crud_category
+from app.crud import organization as crud_organization
 from datetime import datetime, timedelta
 import random
 
@@ -255,6 +257,10 @@ def seed_data():
 
         db.commit()
 
+        # Announcements above bypass crud, so recount the feed counters
+        crud_category.reconcile_announcements_counts(db)
+        crud_organization.reconcile_feed_counts(db)
+
         print("\n" + "="*60)
         print("TEST DATA SUMMARY")
         print("="*60)
@@ -2,15 +2,39 @@ import apiClient from './client'
 import type {
   Announcement,
   AnnouncementList,
+  AnnouncementPage,
   AnnouncementCreate,
   AnnouncementUpdate,
   AnnouncementStatus,
+  CategoryMatch,
 } from '@/types'
 
+// Send arrays as repeated keys (category_id=1&category_id=2), as FastAPI expects
+const repeatedParams = { indexes: null }
+
 export const announcementsApi = {
-  getPublished: async (skip = 0, limit = 20): Promise<AnnouncementList[]> => {
+  getPublished: async (
+    skip = 0,
+    limit = 20,
+    categoryIds?: number[],
+    categoryMatch: CategoryMatch = 'any'
+  ): Promise<AnnouncementList[]> => {
     const response = await apiClient.get<AnnouncementList[]>('/announcements/', {
-      params: { skip, limit },
+      params: { skip, limit, category_id: categoryIds, category_match: categoryMatch },
+      paramsSerializer: repeatedParams,
+    })
+    return response.data
+  },
+
+  getFeed: async (
+    cursor?: string,
+    limit = 20,
+    categoryIds?: number[],
+    categoryMatch: CategoryMatch = 'any'
+  ): Promise<AnnouncementPage> => {
+    const response = await apiClient.get<AnnouncementPage>('/announcements/feed', {
+      params: { cursor, limit, category_id: categoryIds, category_match: categoryMatch },
+      paramsSerializer: repeatedParams,
     })
     return response.data
   },
@@ -7,6 +7,15 @@ export const authApi = {
     return response.data
   },
 
+  refresh: async (refreshToken: string): Promise<TokenResponse> => {
+    const response = await apiClient.post<TokenResponse>('/auth/refresh', { refresh_token: refreshToken })
+    return response.data
+  },
+
+  logout: async (refreshToken: string): Promise<void> => {
+    await apiClient.post('/auth/logout', { refresh_token: refreshToken })
+  },
+
   register: async (data: RegisterRequest): Promise<User> => {
     const response = await apiClient.post<User>('/auth/register', data)
     return response.data
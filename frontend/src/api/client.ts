@@ -23,12 +23,44 @@ apiClient.interceptors.request.use(
   }
 )
 
-// Handle 401 responses
+// Single in-flight refresh shared by all requests that got a 401
+let refreshPromise: Promise<string> | null = null
+
+const refreshAccessToken = (refreshToken: string): Promise<string> => {
+  if (!refreshPromise) {
+    refreshPromise = axios
+      .post(`${API_BASE_URL}/auth/refresh`, { refresh_token: refreshToken })
+      .then((response) => {
+        localStorage.setItem('token', response.data.access_token)
+        localStorage.setItem('refresh_token', response.data.refresh_token)
+        return response.data.access_token as string
+      })
+      .finally(() => {
+        refreshPromise = null
+      })
+  }
+  return refreshPromise
+}
+
+// Handle 401 responses: try the refresh token once, then send the user to login
 apiClient.interceptors.response.use(
   (response) => response,
-  (error) => {
+  async (error) => {
+    const original = error.config
+    const refreshToken = localStorage.getItem('refresh_token')
+    if (error.response?.status === 401 && refreshToken && original && !original._retry) {
+      original._retry = true
+      try {
+        const token = await refreshAccessToken(refreshToken)
+        original.headers.Authorization = `Bearer ${token}`
+        return apiClient(original)
+      } catch (refreshError) {
+        // fall through to the logout below
+      }
+    }
     if (error.response?.status === 401) {
       localStorage.removeItem('token')
+      localStorage.removeItem('refresh_token')
       window.location.href = '/login'
     }
     return Promise.reject(error)
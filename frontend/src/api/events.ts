@@ -2,6 +2,7 @@ import apiClient from './client'
 import type {
   Event,
   EventList,
+  EventPage,
   EventCreate,
   EventUpdate,
   EventRegistration,
@@ -21,6 +22,14 @@ export const eventsApi = {
     return response.data
   },
 
+  // Get published events page by cursor
+  getFeed: async (cursor?: string, limit = 20): Promise<EventPage> => {
+    const response = await apiClient.get('/events/feed', {
+      params: { cursor, limit },
+    })
+    return response.data
+  },
+
   // Get event by slug
   getBySlug: async (slug: string): Promise<Event> => {
     const response = await apiClient.get(`/events/${slug}`)
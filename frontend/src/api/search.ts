@@ -0,0 +1,16 @@
+import apiClient from './client'
+import type { SearchResults } from '@/types'
+
+export const searchApi = {
+  search: async (
+    q: string,
+    type?: 'announcement' | 'event',
+    skip = 0,
+    limit = 20
+  ): Promise<SearchResults> => {
+    const response = await apiClient.get<SearchResults>('/search/', {
+      params: { q, type, skip, limit },
+    })
+    return response.data
+  },
+}
@@ -1,8 +1,29 @@
 import apiClient from './client'
 
+interface ImageVariant {
+  width: number
+  height: number
+  webp: string
+  jpeg: string
+}
+
 interface UploadResponse {
+  id: string
   filename: string
+  status: 'pending' | 'ready' | 'failed'
+  // Original file until the variants are ready
   url: string
+  original_url: string
+  status_url: string
+}
+
+interface ImageStatusResponse {
+  id: string
+  status: 'pending' | 'ready' | 'failed'
+  detail?: string
+  url?: string
+  variants?: Record<'thumb' | 'card' | 'full', ImageVariant>
+  srcset?: Record<'webp' | 'jpeg', string>
 }
 
 interface MultiUploadResponse {
@@ -35,4 +56,9 @@ export const uploadApi = {
     })
     return response.data
   },
+
+  getImageStatus: async (id: string): Promise<ImageStatusResponse> => {
+    const response = await apiClient.get<ImageStatusResponse>(`/upload/image/${id}`)
+    return response.data
+  },
 }
@@ -3,7 +3,7 @@ import { useParams, useNavigate } from 'react-router-dom'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { eventsApi } from '@/api/events'
 import { useAuthStore } from '@/store/authStore'
-import { EventRegistrationCreate } from '@/types'
+import { EventRegistration, EventRegistrationCreate, RegistrationStatus } from '@/types'
 
 export default function EventDetailPage() {
   const { slug } = useParams<{ slug: string }>()
@@ -12,6 +12,7 @@ export default function EventDetailPage() {
   const { user, isAuthenticated } = useAuthStore()
 
   const [showRegistrationForm, setShowRegistrationForm] = useState(false)
+  const [registrationStatus, setRegistrationStatus] = useState<RegistrationStatus | null>(null)
   const [formData, setFormData] = useState<EventRegistrationCreate>({
     event_id: 0,
     guest_name: '',
@@ -30,9 +31,15 @@ export default function EventDetailPage() {
     mutationFn: (data: EventRegistrationCreate) => {
       return eventsApi.register(event!.id, data)
     },
-    onSuccess: () => {
+    onSuccess: (registration: EventRegistration) => {
       queryClient.invalidateQueries({ queryKey: ['events', slug] })
-      alert('Вы успешно зарегистрированы на мероприятие!')
+      // A full event still accepts the registration, but only onto the waitlist
+      if (registration.status === RegistrationStatus.WAITLISTED) {
+        alert('Все места заняты. Вы добавлены в лист ожидания и получите место, если кто-то отменит регистрацию.')
+      } else {
+        alert('Вы успешно зарегистрированы на мероприятие!')
+      }
+      setRegistrationStatus(registration.status)
       setShowRegistrationForm(false)
       setFormData({
         event_id: 0,
@@ -81,6 +88,8 @@ export default function EventDetailPage() {
     : null
   const isRegistrationClosed =
     registrationDeadline && registrationDeadline < new Date()
+  const isEventFull =
+    !!event.max_participants && event.registrations_count >= event.max_participants
 
   return (
     <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
@@ -154,15 +163,34 @@ export default function EventDetailPage() {
         <p className="text-gray-700">{event.author.full_name || event.author.email}</p>
       </div>
 
-      {!isPastEvent && !isRegistrationClosed && (
+      {registrationStatus === RegistrationStatus.WAITLISTED && (
+        <div className="bg-yellow-100 rounded-lg p-6 mb-6 text-center text-yellow-800">
+          Вы в листе ожидания. Место будет предоставлено, если кто-то из участников отменит регистрацию.
+        </div>
+      )}
+
+      {registrationStatus === RegistrationStatus.CONFIRMED && (
+        <div className="bg-green-100 rounded-lg p-6 mb-6 text-center text-green-800">
+          Вы зарегистрированы на мероприятие
+        </div>
+      )}
+
+      {!isPastEvent && !isRegistrationClosed && !registrationStatus && (
         <div className="bg-white rounded-lg shadow-md p-6">
           {!showRegistrationForm ? (
-            <button
-              onClick={() => setShowRegistrationForm(true)}
-              className="w-full bg-primary-600 text-white px-6 py-3 rounded-md hover:bg-primary-700 font-medium"
-            >
-              Зарегистрироваться на мероприятие
-            </button>
+            <>
+              {isEventFull && (
+                <p className="mb-4 text-center text-gray-600">
+                  Все места заняты — можно записаться в лист ожидания
+                </p>
+              )}
+              <button
+                onClick={() => setShowRegistrationForm(true)}
+                className="w-full bg-primary-600 text-white px-6 py-3 rounded-md hover:bg-primary-700 font-medium"
+              >
+                {isEventFull ? 'Записаться в лист ожидания' : 'Зарегистрироваться на мероприятие'}
+              </button>
+            </>
           ) : (
             <div>
               <h3 className="text-xl font-semibold mb-4">Регистрация на мероприятие</h3>
@@ -48,13 +48,16 @@ export default function HomePage() {
                 <h2 className="text-xl font-semibold text-gray-900 mb-2">
                   {announcement.title}
                 </h2>
-                {announcement.excerpt && (
-                  <p className="text-gray-600 mb-4 line-clamp-3">{announcement.excerpt}</p>
+                {(announcement.excerpt || announcement.auto_excerpt) && (
+                  <p className="text-gray-600 mb-4 line-clamp-3">
+                    {announcement.excerpt || announcement.auto_excerpt}
+                  </p>
                 )}
                 <div className="flex items-center justify-between text-sm text-gray-500">
                   <span>{announcement.author.full_name || announcement.author.email}</span>
                   <span>
                     {new Date(announcement.published_at || announcement.created_at).toLocaleDateString('ru-RU')}
+                    {!!announcement.reading_time && ` · ${announcement.reading_time} мин`}
                   </span>
                 </div>
                 {announcement.categories.length > 0 && (
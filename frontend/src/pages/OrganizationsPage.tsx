@@ -52,6 +52,16 @@ export default function OrganizationsPage() {
                 {organization.description && (
                   <p className="text-gray-600 mb-4 line-clamp-3">{organization.description}</p>
                 )}
+                <div className="flex gap-2 mb-4 text-xs">
+                  <span className="bg-primary-100 text-primary-800 px-2 py-1 rounded">
+                    Публикаций: {organization.announcements_count}
+                  </span>
+                  {!!organization.upcoming_events_count && (
+                    <span className="bg-gray-100 text-gray-700 px-2 py-1 rounded">
+                      Предстоящих событий: {organization.upcoming_events_count}
+                    </span>
+                  )}
+                </div>
                 {organization.website && (
                   <a
                     href={organization.website}
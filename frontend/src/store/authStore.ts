@@ -24,6 +24,9 @@ export const useAuthStore = create<AuthState>((set, get) => ({
     try {
       const response = await authApi.login({ email, password })
       localStorage.setItem('token', response.access_token)
+      if (response.refresh_token) {
+        localStorage.setItem('refresh_token', response.refresh_token)
+      }
 
       const user = await authApi.getCurrentUser()
       set({
@@ -39,7 +42,12 @@ export const useAuthStore = create<AuthState>((set, get) => ({
   },
 
   logout: () => {
+    const refreshToken = localStorage.getItem('refresh_token')
+    if (refreshToken) {
+      authApi.logout(refreshToken).catch(() => {})
+    }
     localStorage.removeItem('token')
+    localStorage.removeItem('refresh_token')
     set({
       user: null,
       token: null,
@@ -65,6 +73,7 @@ export const useAuthStore = create<AuthState>((set, get) => ({
       })
     } catch (error) {
       localStorage.removeItem('token')
+      localStorage.removeItem('refresh_token')
       set({
         user: null,
         token: null,
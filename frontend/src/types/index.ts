@@ -25,10 +25,13 @@ export interface Category {
   name: string
   slug: string
   description?: string
+  announcements_count: number
   created_at: string
   updated_at?: string
 }
 
+export type CategoryMatch = 'any' | 'all'
+
 export interface Organization {
   id: number
   name: string
@@ -38,6 +41,8 @@ export interface Organization {
   website?: string
   email?: string
   is_active: boolean
+  announcements_count: number
+  upcoming_events_count?: number  // Only returned by the organizations endpoints
   created_at: string
   updated_at?: string
 }
@@ -60,6 +65,9 @@ export interface Announcement {
   slug: string
   content: string
   excerpt?: string
+  auto_excerpt?: string
+  word_count?: number
+  reading_time?: number
   cover_image?: string
   status: AnnouncementStatus
   author_id: number
@@ -79,6 +87,9 @@ export interface AnnouncementList {
   title: string
   slug: string
   excerpt?: string
+  auto_excerpt?: string
+  word_count?: number
+  reading_time?: number
   cover_image?: string
   status: AnnouncementStatus
   author: User
@@ -89,6 +100,11 @@ export interface AnnouncementList {
   created_at: string
 }
 
+export interface AnnouncementPage {
+  items: AnnouncementList[]
+  next_cursor?: string
+}
+
 export interface LoginRequest {
   email: string
   password: string
@@ -103,6 +119,7 @@ export interface RegisterRequest {
 export interface TokenResponse {
   access_token: string
   token_type: string
+  refresh_token?: string
 }
 
 export interface UserCreate {
@@ -225,6 +242,7 @@ export enum EventStatus {
 export enum RegistrationStatus {
   PENDING = 'pending',
   CONFIRMED = 'confirmed',
+  WAITLISTED = 'waitlisted',
   CANCELLED = 'cancelled',
 }
 
@@ -264,6 +282,11 @@ export interface EventList {
   registrations_count: number
 }
 
+export interface EventPage {
+  items: EventList[]
+  next_cursor?: string
+}
+
 export interface EventCreate {
   title: string
   slug: string
@@ -312,3 +335,18 @@ export interface EventRegistrationCreate {
   guest_phone?: string
   notes?: string
 }
+
+export interface SearchHit {
+  type: 'announcement' | 'event'
+  id: number
+  slug: string
+  title: string
+  excerpt?: string
+  published_at?: string
+  score: number
+}
+
+export interface SearchResults {
+  items: SearchHit[]
+  total: number
+}